@@ -14,6 +14,7 @@ Exits with code 0 when the version is available, 1 on timeout or error.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import socket
@@ -38,8 +39,6 @@ def fetch_json(url: str, timeout: float = 10.0) -> dict[str, Any]:
 
 def pep503_normalize(name: str) -> str:
     """Normalize a package name per PEP 503 (simple API canonical form)."""
-    import re
-
     return re.sub(r"[-_.]+", "-", name).lower()
 
 
@@ -102,6 +101,26 @@ def _urlopen(url_or_req, *hosts: str, timeout: float = 10.0):  # type: ignore[no
     return opener.open(url_or_req, timeout=timeout)
 
 
+_HREF_RE = re.compile(r'href=[\'"]([^\'"]+)[\'"]')
+
+
+@functools.lru_cache(maxsize=None)
+def _filename_pattern(normalized: str, version: str) -> re.Pattern[str]:
+    """Compile the exact-release filename pattern once per package/version.
+
+    ``main`` polls the index up to ``retries`` times for the same release,
+    so the pattern would otherwise be rebuilt on every attempt.
+    """
+    # Wheels escape the name with underscores (PEP 427); sdists use the
+    # raw project name. Accept either, then require the version to be
+    # followed by a wheel's '-' or an sdist's extension.
+    stem = re.escape(normalized).replace(r"\-", "[-_]")
+    return re.compile(
+        rf"^{stem}-{re.escape(version)}(?:-[^/]*\.whl|\.tar\.gz|\.zip)$",
+        re.IGNORECASE,
+    )
+
+
 def file_urls_for_version(
     package: str, version: str, timeout: float = 10.0
 ) -> list[str]:
@@ -116,16 +135,9 @@ def file_urls_for_version(
     with _urlopen(simple_url, "pypi.org", timeout=timeout) as r:
         html = r.read().decode("utf-8", errors="replace")
 
-    # Wheels escape the name with underscores (PEP 427); sdists use the
-    # raw project name. Accept either, then require the version to be
-    # followed by a wheel's '-' or an sdist's extension.
-    stem = re.escape(normalized).replace(r"\-", "[-_]")
-    pattern = re.compile(
-        rf"^{stem}-{re.escape(version)}(?:-[^/]*\.whl|\.tar\.gz|\.zip)$",
-        re.IGNORECASE,
-    )
+    pattern = _filename_pattern(normalized, version)
     urls: list[str] = []
-    for href in re.findall(r'href=[\'"]([^\'"]+)[\'"]', html):
+    for href in _HREF_RE.findall(html):
         # PEP 503 permits relative links; PyPI serves absolute ones to
         # files.pythonhosted.org. Resolve against the index either way.
         clean = urljoin(simple_url, href.split("#", 1)[0])
@@ -6,6 +6,11 @@ For flows that benefit from a light OO wrapper (e.g., persisting bucket/host
 config), thin connector classes are available in ``zyra.connectors.clients``.
 """
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
 from . import discovery as discovery  # help linters/IDE resolve subpackage
 from .base import (
     ByteRanged,
@@ -18,7 +23,6 @@ from .base import (
     Statable,
     Uploadable,
 )
-from .clients import FTPConnector, S3Connector
 
 __all__ = [
     # Base typing and optional abstract
@@ -37,3 +41,21 @@ __all__ = [
     # Subpackages
     "discovery",
 ]
+
+
+_LAZY_CLIENTS = frozenset({"FTPConnector", "S3Connector"})
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily expose the OO clients.
+
+    They pull in the FTP and S3 backends (and boto3), which discovery-only
+    callers such as offline enrichment never use.
+    """
+    if name in _LAZY_CLIENTS:
+        return getattr(import_module("zyra.connectors.clients"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_CLIENTS)
@@ -14,6 +14,7 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import queue
 import re
 import warnings
 from collections.abc import Iterable
@@ -24,7 +25,13 @@ from io import BytesIO
 from pathlib import Path
 
 from zyra.utils.date_manager import DateManager
-from zyra.utils.grib import compute_chunks, ensure_idx_path, parse_idx_lines
+from zyra.utils.grib import (
+    COALESCE_MAX_GAP,
+    coalesced_download_byteranges,
+    compute_chunks,
+    ensure_idx_path,
+    parse_idx_lines,
+)
 
 _DELEGATE_NONE = object()
 
@@ -833,7 +840,7 @@ def get_idx_lines(
     ftp.retrbinary(f"RETR {filename}", buf.write)
     with contextlib.suppress(Exception):
         ftp.quit()
-    lines = parse_idx_lines(buf.getvalue())
+    lines = parse_idx_lines(buf.getbuffer())
     if write_to:
         outp = write_to if write_to.endswith(".idx") else f"{write_to}.idx"
         try:
@@ -877,8 +884,13 @@ def download_byteranges(
     timeout: int = 30,
     username: str | None = None,
     password: str | None = None,
+    max_gap: int | None = COALESCE_MAX_GAP,
 ) -> bytes:
-    """Download multiple ranges via FTP REST and concatenate in the input order."""
+    """Download multiple ranges via FTP REST and concatenate in the input order.
+
+    Ranges at most ``max_gap`` bytes apart are fetched with a single ``RETR``
+    and sliced back apart; pass ``max_gap=None`` to disable coalescing.
+    """
     v = _maybe_delegate(
         "download_byteranges",
         url_or_path,
@@ -894,53 +906,92 @@ def download_byteranges(
         url_or_path, username=username, password=password
     )
 
-    def _worker(_range: str) -> bytes:
-        start_end = _range.replace("bytes=", "").split("-")
-        start = int(start_end[0]) if start_end[0] else 0
-        if start_end[1]:
-            end = int(start_end[1])
-        else:
-            sz = get_size(url_or_path) or 0
-            end = max(sz - 1, start)
-        ftp = FTP(timeout=timeout)
-        ftp.connect(host)
-        ftp.login(user=(user or "anonymous"), passwd=(pwd or "test@test.com"))
-        ftp.set_pasv(True)
-        directory = ""
-        filename = remote_path
-        if "/" in remote_path:
-            directory, filename = remote_path.rsplit("/", 1)
-        if directory:
-            ftp.cwd(directory)
-        remaining = end - start + 1
-        out = BytesIO()
-
-        class _Stop(Exception):
-            pass
-
-        def _cb(chunk: bytes):
-            nonlocal remaining
-            if remaining <= 0:
-                raise _Stop()
-            take = min(len(chunk), remaining)
-            if take:
-                out.write(chunk[:take])
-                remaining -= take
-            if remaining <= 0:
-                raise _Stop()
+    directory = ""
+    filename = remote_path
+    if "/" in remote_path:
+        directory, filename = remote_path.rsplit("/", 1)
+    # Logged-in sessions are pooled and shared by the workers so each range
+    # reuses an existing control connection instead of reconnecting/logging in.
+    pool: queue.SimpleQueue[FTP] = queue.SimpleQueue()
 
+    def _acquire() -> FTP:
         try:
-            ftp.retrbinary(f"RETR {filename}", _cb, rest=start)
-        except _Stop:
-            with contextlib.suppress(Exception):
-                ftp.abort()
+            return pool.get_nowait()
+        except queue.Empty:
+            ftp = FTP(timeout=timeout)
+            ftp.connect(host)
+            ftp.login(user=(user or "anonymous"), passwd=(pwd or "test@test.com"))
+            ftp.set_pasv(True)
+            if directory:
+                ftp.cwd(directory)
+            return ftp
+
+    def _discard(ftp: FTP) -> None:
         with contextlib.suppress(Exception):
             ftp.quit()
-        return out.getvalue()
 
-    from concurrent.futures import ThreadPoolExecutor
+    class _Stop(Exception):
+        pass
 
-    results: list[bytes] = []
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        results = list(ex.map(_worker, list(byte_ranges)))
-    return b"".join(results)
+    def _worker(_key: str, _range: str) -> bytes:
+        start_end = _range.replace("bytes=", "").split("-")
+        start = int(start_end[0]) if start_end[0] else 0
+        ftp = _acquire()
+        try:
+            if start_end[1]:
+                end = int(start_end[1])
+            else:
+                sz = ftp.size(filename) or 0
+                end = max(sz - 1, start)
+            # Fill a preallocated buffer in place; no per-chunk slicing copies
+            buf = bytearray(max(0, end - start + 1))
+            view = memoryview(buf)
+            filled = 0
+
+            def _cb(chunk: bytes):
+                nonlocal filled
+                take = min(len(chunk), len(buf) - filled)
+                if take > 0:
+                    view[filled : filled + take] = memoryview(chunk)[:take]
+                    filled += take
+                if filled >= len(buf):
+                    raise _Stop()
+
+            def _result() -> bytes:
+                # Short reads (e.g., EOF before the requested end) keep what arrived
+                data = view[:filled].tobytes()
+                view.release()
+                return data
+
+            if not buf:
+                pool.put(ftp)
+                return b""
+            try:
+                ftp.retrbinary(f"RETR {filename}", _cb, rest=start)
+            except _Stop:
+                # Closing the data connection early leaves exactly one pending
+                # reply (226 or 426) on the control channel; consume it so the
+                # session can be reused. Sessions that cannot be resynced are
+                # dropped instead of returned to the pool.
+                try:
+                    ftp.voidresp()
+                except all_errors as exc:
+                    if not str(exc).startswith("426"):
+                        _discard(ftp)
+                        return _result()
+        except Exception:
+            _discard(ftp)
+            raise
+        pool.put(ftp)
+        return _result()
+
+    try:
+        return coalesced_download_byteranges(
+            _worker, remote_path, byte_ranges, max_workers=max_workers, max_gap=max_gap
+        )
+    finally:
+        while True:
+            try:
+                _discard(pool.get_nowait())
+            except queue.Empty:
+                break
@@ -11,8 +11,9 @@ the CLI, pipelines, or higher-level wrappers without imposing heavy imports.
 
 from __future__ import annotations
 
+import contextlib
 import re
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 from urllib.parse import urljoin
 
 from zyra.connectors.backends._retry import (
@@ -21,6 +22,11 @@ from zyra.connectors.backends._retry import (
     DEFAULT_MAX_DELAY,
     with_retries,
 )
+from zyra.utils.grib import COALESCE_MAX_GAP
+
+# Anchor targets on index pages; a narrow regex is all listing needs, and
+# compiling it once keeps large directory pages cheap to scan.
+_HREF_RE = re.compile(r"""href\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
 
 
 def _retry_opts() -> dict[str, Any]:
@@ -64,6 +70,32 @@ except Exception:  # pragma: no cover
     requests = _RequestsProxy()  # type: ignore
 
 
+@contextlib.contextmanager
+def _ranged_session(req: Any) -> Iterator[Any]:
+    """Yield a ``requests.Session`` for one :func:`download_byteranges` call.
+
+    Ranged GETs for one file hit the same host many times in parallel; a
+    session keeps TCP/TLS connections alive across them instead of
+    reconnecting per range. It is scoped to the call and closed afterwards,
+    so cookies and auth state never carry over to unrelated fetches. The
+    pool is sized above ``default_max_workers``.
+
+    Stand-ins without ``Session`` (tests swap ``sys.modules['requests']``)
+    are yielded as-is so their module-level functions are used.
+    """
+    if not hasattr(req, "Session"):
+        yield req
+        return
+    session = req.Session()
+    try:
+        adapter = req.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        yield session
+    finally:
+        session.close()
+
+
 def fetch_bytes(
     url: str, *, timeout: int = 60, headers: dict[str, str] | None = None
 ) -> bytes:
@@ -175,13 +207,11 @@ def list_files(
 
     r = requests.get(url, timeout=timeout, headers=headers)
     r.raise_for_status()
-    text = r.text
-    hrefs = re.findall(r'href=["\']([^"\']+)["\']', text, re.IGNORECASE)
-    results: list[str] = []
-    for href in hrefs:
-        if href.startswith("?") or href.startswith("#"):
-            continue
-        results.append(urljoin(url, href))
+    results = [
+        urljoin(url, href)
+        for href in _HREF_RE.findall(r.text)
+        if not href.startswith(("?", "#"))
+    ]
     if pattern:
         rx = re.compile(pattern)
         results = [u for u in results if rx.search(u)]
@@ -224,34 +254,41 @@ def download_byteranges(
     max_workers: int | None = None,
     timeout: int = 60,
     headers: dict[str, str] | None = None,
+    max_gap: int | None = COALESCE_MAX_GAP,
 ) -> bytes:
-    """Download multiple byte ranges and concatenate in the input order."""
+    """Download multiple byte ranges and concatenate in the input order.
+
+    Ranges at most ``max_gap`` bytes apart are fetched with a single request
+    and sliced back apart; pass ``max_gap=None`` for one request per range.
+    """
     try:
         import requests  # type: ignore
     except Exception as exc:  # pragma: no cover - optional dep
         raise RuntimeError("HTTP backend requires the 'requests' extra") from exc
 
     base_headers = dict(headers or {})
+    from zyra.utils.grib import coalesced_download_byteranges
 
-    def _ranged_get(u: str, range_header: str) -> bytes:
-        request_headers = dict(base_headers)
-        request_headers["Range"] = range_header
+    with _ranged_session(requests) as session:
 
-        def _get() -> bytes:
-            r = requests.get(u, headers=request_headers, timeout=timeout)
-            r.raise_for_status()
-            return r.content
+        def _ranged_get(u: str, range_header: str) -> bytes:
+            request_headers = dict(base_headers)
+            request_headers["Range"] = range_header
 
-        return with_retries(_get, **_retry_opts())
+            def _get() -> bytes:
+                r = session.get(u, headers=request_headers, timeout=timeout)
+                r.raise_for_status()
+                return r.content
 
-    from zyra.utils.grib import parallel_download_byteranges
+            return with_retries(_get, **_retry_opts())
 
-    return parallel_download_byteranges(
-        _ranged_get,
-        url,
-        byte_ranges,
-        max_workers=default_max_workers() if max_workers is None else max_workers,
-    )
+        return coalesced_download_byteranges(
+            _ranged_get,
+            url,
+            byte_ranges,
+            max_workers=default_max_workers() if max_workers is None else max_workers,
+            max_gap=max_gap,
+        )
 
 
 def get_size(
@@ -32,8 +32,9 @@ except ModuleNotFoundError:  # pragma: no cover - optional dep
 
 from zyra.utils.date_manager import DateManager
 from zyra.utils.grib import (
+    COALESCE_MAX_GAP,
+    coalesced_download_byteranges,
     ensure_idx_path,
-    parallel_download_byteranges,
     parse_idx_lines,
 )
 
@@ -311,32 +312,36 @@ def download_byteranges(
     unsigned: bool = False,
     max_workers: int = 10,
     timeout: int = 30,
+    max_gap: int | None = COALESCE_MAX_GAP,
 ) -> bytes:
-    """Download multiple byte ranges from an S3 object and concatenate in order."""
+    """Download multiple byte ranges from an S3 object and concatenate in order.
+
+    Ranges at most ``max_gap`` bytes apart are fetched with a single
+    ``GetObject`` and sliced back apart; pass ``max_gap=None`` to disable.
+    """
     if key is None:
         bucket, key = parse_s3_url(url_or_bucket)
     else:
         bucket = url_or_bucket
     _require_boto3()
+    # Import botocore lazily to avoid import-time failure when optional.
+    from botocore import config as _botocore_config  # type: ignore
+
+    # One client is shared by every worker (boto3 clients are thread-safe);
+    # size its connection pool so parallel ranges do not queue for sockets.
+    cfg: dict[str, object] = {"max_pool_connections": max(10, max_workers * 2)}
     if unsigned:
-        # Import botocore lazily to avoid import-time failure when optional.
-        from botocore import (  # type: ignore
-            UNSIGNED,
-        )
-        from botocore import (
-            config as _botocore_config,
-        )
+        from botocore import UNSIGNED  # type: ignore
 
-        c = boto3.client(  # type: ignore[union-attr]
-            "s3", config=_botocore_config.Config(signature_version=UNSIGNED)
-        )
-    else:
-        c = boto3.client("s3")  # type: ignore[union-attr]
+        cfg["signature_version"] = UNSIGNED
+    c = boto3.client(  # type: ignore[union-attr]
+        "s3", config=_botocore_config.Config(**cfg)
+    )
 
     def _ranged(k: str, rng: str) -> bytes:
         resp = c.get_object(Bucket=bucket, Key=k, Range=rng)
         return resp["Body"].read()
 
-    return parallel_download_byteranges(
-        _ranged, key, byte_ranges, max_workers=max_workers
+    return coalesced_download_byteranges(
+        _ranged, key, byte_ranges, max_workers=max_workers, max_gap=max_gap
     )  # type: ignore[arg-type]
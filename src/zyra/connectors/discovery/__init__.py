@@ -27,6 +27,7 @@ import argparse
 import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Iterable
 
 try:  # optional observability helpers for redaction
@@ -43,6 +44,7 @@ from zyra.connectors.credentials import (
     apply_http_credentials,
     resolve_credentials,
 )
+from zyra.connectors.discovery.utils import json_loads, load_bundled_profile
 
 try:  # Prefer standard library importlib.resources
     from importlib import resources as importlib_resources
@@ -67,6 +69,75 @@ class DiscoveryBackend:
         raise NotImplementedError
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class _CatalogIndex:
+    """Lowercased field columns plus a word -> record-position posting map.
+
+    Query tokens are runs of word characters, so a token occurs as a
+    substring of a field only if it is a substring of one of the field's
+    words. Looking tokens up against the (much smaller) word vocabulary
+    narrows the records that need scoring without changing match semantics.
+    """
+
+    titles: list[str]
+    descriptions: list[str]
+    keywords: list[list[str]]
+    postings: dict[str, list[int]]
+
+    @classmethod
+    def build(cls, data: list[dict[str, Any]]) -> _CatalogIndex:
+        titles: list[str] = []
+        descriptions: list[str] = []
+        keywords: list[list[str]] = []
+        postings: dict[str, list[int]] = {}
+        for pos, item in enumerate(data):
+            title = str(item.get("title") or "").lower()
+            desc = str(item.get("description") or "").lower()
+            kws = [
+                kw.lower() for kw in (item.get("keywords") or []) if isinstance(kw, str)
+            ]
+            titles.append(title)
+            descriptions.append(desc)
+            keywords.append(kws)
+            words = set(_WORD_RE.findall(title))
+            words.update(_WORD_RE.findall(desc))
+            for kw in kws:
+                words.update(_WORD_RE.findall(kw))
+            for w in words:
+                postings.setdefault(w, []).append(pos)
+        return cls(titles, descriptions, keywords, postings)
+
+    def candidates(self, token: str) -> set[int]:
+        """Return positions of records with a word containing ``token``."""
+        hits: set[int] = set()
+        for word, positions in self.postings.items():
+            if token in word:
+                hits.update(positions)
+        return hits
+
+
+@lru_cache(maxsize=None)
+def _load_packaged_catalog(
+    pkg: str, res: str
+) -> tuple[list[dict[str, Any]], _CatalogIndex]:
+    """Read, parse, and index a packaged catalog once per process.
+
+    Packaged resources are immutable at runtime, so every
+    ``LocalCatalogBackend`` reading the same ``pkg:`` reference shares one
+    parsed list and index. Use :func:`reset_catalog_cache` to drop them.
+    """
+    data = json_loads(importlib_resources.files(pkg).joinpath(res).read_bytes())
+    return data, _CatalogIndex.build(data)
+
+
+def reset_catalog_cache() -> None:
+    """Forget packaged catalogs memoized by :class:`LocalCatalogBackend`."""
+    _load_packaged_catalog.cache_clear()
+
+
 class LocalCatalogBackend(DiscoveryBackend):
     """Local backend backed by the packaged SOS catalog JSON.
 
@@ -80,6 +151,7 @@ class LocalCatalogBackend(DiscoveryBackend):
     """
 
     _cache: list[dict[str, Any]] | None = None
+    _index: _CatalogIndex | None = None
 
     def __init__(
         self, catalog_path: str | None = None, *, weights: dict[str, int] | None = None
@@ -104,9 +176,7 @@ class LocalCatalogBackend(DiscoveryBackend):
                     parts = ref.split("/", 1)
                     pkg = parts[0]
                     res = parts[1] if len(parts) > 1 else "sos_dataset_metadata.json"
-                path = importlib_resources.files(pkg).joinpath(res)
-                with importlib_resources.as_file(path) as p:
-                    data = json.loads(p.read_text(encoding="utf-8"))
+                data, self._index = _load_packaged_catalog(pkg, res)
             else:
                 # Optional allowlist: if env vars are set, require catalog under one of them
                 try:
@@ -205,14 +275,13 @@ class LocalCatalogBackend(DiscoveryBackend):
                     pass
                 if not resolved.is_file():
                     raise FileNotFoundError(str(resolved))
-                data = json.loads(
-                    resolved.read_text(encoding="utf-8")
+                data = json_loads(
+                    resolved.read_bytes()
                 )  # lgtm [py/path-injection] [py/uncontrolled-data-in-path-expression]
         else:
-            pkg = "zyra.assets.metadata"
-            path = importlib_resources.files(pkg).joinpath("sos_dataset_metadata.json")
-            with importlib_resources.as_file(path) as p:
-                data = json.loads(p.read_text(encoding="utf-8"))
+            data, self._index = _load_packaged_catalog(
+                "zyra.assets.metadata", "sos_dataset_metadata.json"
+            )
         # Store as-is; we'll normalize per-result on demand
         self._cache = data
         return data
@@ -231,6 +300,24 @@ class LocalCatalogBackend(DiscoveryBackend):
                 score += int(self._weights.get("keywords", 1))
         return score
 
+    def _load_index(self) -> _CatalogIndex:
+        data = self._load()
+        if self._index is None:
+            self._index = _CatalogIndex.build(data)
+        return self._index
+
+    def _token_score(self, idx: _CatalogIndex, pos: int, token: str) -> int:
+        # Same weighting as _match_score, against prelowered columns
+        score = 0
+        if token in idx.titles[pos]:
+            score += int(self._weights.get("title", 3))
+        if token in idx.descriptions[pos]:
+            score += int(self._weights.get("description", 2))
+        for kw in idx.keywords[pos]:
+            if token in kw:
+                score += int(self._weights.get("keywords", 1))
+        return score
+
     @staticmethod
     def _slug_from_url(url: str) -> str:
         # e.g., https://sos.noaa.gov/catalog/datasets/tsunami-history/ -> tsunami-history
@@ -274,18 +361,20 @@ class LocalCatalogBackend(DiscoveryBackend):
     def search(self, query: str, *, limit: int = 10) -> list[DatasetMetadata]:
         data = self._load()
         # Token-aware matching: break the query into words and score per-token
-        tokens = [t for t in re.split(r"\W+", query) if t]
-        token_patterns = [
-            re.compile(re.escape(t), re.IGNORECASE) for t in tokens if len(t) >= 3
-        ]
+        tokens = [t.lower() for t in re.split(r"\W+", query) if t]
+        tokens = [t for t in tokens if len(t) >= 3]
         scored: list[tuple[int, dict[str, Any]]] = []
-        if token_patterns:
-            for it in data:
+        if tokens:
+            # Only records with a word containing some token can score
+            idx = self._load_index()
+            per_token = [(t, idx.candidates(t)) for t in tokens]
+            for pos in sorted(set().union(*(c for _, c in per_token))):
                 s = 0
-                for pat in token_patterns:
-                    s += self._match_score(it, pat)
+                for t, cands in per_token:
+                    if pos in cands:
+                        s += self._token_score(idx, pos, t)
                 if s > 0:
-                    scored.append((s, it))
+                    scored.append((s, data[pos]))
         else:
             # Fallback to phrase search when no meaningful tokens extracted
             rx = re.compile(re.escape(query), re.IGNORECASE)
@@ -863,11 +952,7 @@ def register_cli(p: argparse.ArgumentParser) -> None:
         # Bundled profile by name
         if getattr(ns, "profile", None):
             try:
-                pkg = "zyra.assets.profiles"
-                res = f"{ns.profile}.json"
-                path = importlib_resources.files(pkg).joinpath(res)
-                with importlib_resources.as_file(path) as p:
-                    prof0 = json.loads(p.read_text(encoding="utf-8"))
+                prof0 = load_bundled_profile(ns.profile)
                 prof_sources.update(dict(prof0.get("sources") or {}))
                 prof_weights.update(
                     {k: int(v) for k, v in (prof0.get("weights") or {}).items()}
@@ -928,13 +1013,7 @@ def register_cli(p: argparse.ArgumentParser) -> None:
                 ns, "profile_file", None
             ):
                 try:
-                    pkg = "zyra.assets.profiles"
-                    res = "sos.json"
-                    path = importlib_resources.files(pkg).joinpath(res)
-                    with importlib_resources.as_file(path) as p:
-                        import json as _json
-
-                        prof0 = _json.loads(p.read_text(encoding="utf-8"))
+                    prof0 = load_bundled_profile("sos")
                     enr = prof0.get("enrichment") or {}
                     ed = enr.get("defaults") or {}
                     if isinstance(ed, dict):
@@ -1108,12 +1187,9 @@ def _semantic_search(ns: argparse.Namespace) -> list[DatasetMetadata]:
     prof_weights: dict[str, int] = {}
     if isinstance(profile, str) and profile:
         from contextlib import suppress
-        from importlib import resources as ir
 
         with suppress(Exception):
-            base = ir.files("zyra.assets.profiles").joinpath(profile + ".json")
-            with ir.as_file(base) as p:
-                pr = json.loads(p.read_text(encoding="utf-8"))
+            pr = load_bundled_profile(profile)
             prof_sources = dict(pr.get("sources") or {})
             prof_weights = {k: int(v) for k, v in (pr.get("weights") or {}).items()}
 
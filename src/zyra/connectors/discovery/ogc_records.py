@@ -6,17 +6,21 @@ entries for features whose title/description match the query.
 
 Network fetching is optional; tests can pass a JSON payload via `items_json`.
 If fetching is needed and `requests` is unavailable, raises a helpful error.
+
+The payload is parsed once per backend instance and flattened into parallel
+lowercased columns (titles, descriptions, ids, keywords, ...) so repeated
+searches are a single pass of substring checks. ``orjson`` is used for
+decoding when installed (see :mod:`.utils`); otherwise the stdlib ``json``
+module is used.
 """
 
 from __future__ import annotations
 
-import json
-import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from . import DatasetMetadata, DiscoveryBackend
-from .utils import slugify
+from .utils import json_loads, slugify
 
 
 def _slug(s: str) -> str:
@@ -24,28 +28,92 @@ def _slug(s: str) -> str:
     return slugify(s)
 
 
+@dataclass
+class _RecordColumns:
+    """Columnar (structure-of-arrays) view over Records features."""
+
+    titles: list[str] = field(default_factory=list)
+    descriptions: list[str] = field(default_factory=list)
+    uris: list[str | None] = field(default_factory=list)
+    titles_lower: list[str] = field(default_factory=list)
+    descriptions_lower: list[str] = field(default_factory=list)
+    ids_lower: list[str] = field(default_factory=list)
+    link_titles_lower: list[tuple[str, ...]] = field(default_factory=list)
+    keywords_lower: list[tuple[str, ...]] = field(default_factory=list)
+    props_lower: list[tuple[str, ...]] = field(default_factory=list)
+
+
+def _representative_uri(links: list[dict[str, Any]]) -> str | None:
+    # Choose a representative URI: first self or data link
+    for ln in links:
+        rel = (ln.get("rel") or "").lower()
+        href = ln.get("href")
+        if rel in {"self", "data", "collection", "items"} and href:
+            return href
+    return None
+
+
+def _build_columns(data: dict[str, Any]) -> _RecordColumns:
+    cols = _RecordColumns()
+    for f in data.get("features") or []:
+        props = f.get("properties") or {}
+        title = str(props.get("title") or "")
+        desc = str(props.get("description") or "")
+        links = f.get("links") or props.get("links") or []
+        cols.titles.append(title)
+        cols.descriptions.append(desc)
+        cols.uris.append(_representative_uri(links))
+        cols.titles_lower.append(title.lower())
+        cols.descriptions_lower.append(desc.lower())
+        cols.ids_lower.append(str(f.get("id") or "").lower())
+        cols.link_titles_lower.append(
+            tuple(
+                str(ln.get("title")).lower()
+                for ln in links
+                if isinstance(ln, dict) and ln.get("title")
+            )
+        )
+        kws = props.get("keywords")
+        cols.keywords_lower.append(
+            tuple(k.lower() for k in kws if isinstance(k, str))
+            if isinstance(kws, list)
+            else ()
+        )
+        # Generic property values (strings/lists of strings)
+        generic: list[str] = []
+        for k, v in props.items():
+            if k in {"title", "description", "keywords", "links"}:
+                continue
+            if isinstance(v, str):
+                generic.append(v.lower())
+            elif isinstance(v, list):
+                generic.extend(x.lower() for x in v if isinstance(x, str))
+        cols.props_lower.append(tuple(generic))
+    return cols
+
+
 @dataclass
 class OGCRecordsBackend(DiscoveryBackend):
     endpoint: str
     items_json: str | None = None
     weights: dict[str, int] | None = None
+    _columns: _RecordColumns | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def _load_items(self) -> dict[str, Any]:
         if self.items_json is not None:
-            return json.loads(self.items_json)
+            return json_loads(self.items_json)
         url = self.endpoint
         # Offline/local file support
         try:
             from pathlib import Path
 
             if url.startswith("file:"):
-                path = Path(url[5:])
-                with path.open(encoding="utf-8") as f:
-                    return json.loads(f.read())
+                return json_loads(Path(url[5:]).read_bytes())
             p = Path(url)
             if p.exists():
-                with p.open(encoding="utf-8") as f:
-                    return json.loads(f.read())
+                return json_loads(p.read_bytes())
         except Exception:
             pass
         # Append basic query params if none are present
@@ -62,76 +130,57 @@ class OGCRecordsBackend(DiscoveryBackend):
                 "requests is not installed; provide items_json or install connectors extras"
             ) from e
 
+    def _load_columns(self) -> _RecordColumns:
+        if self._columns is None:
+            self._columns = _build_columns(self._load_items())
+        return self._columns
+
     def search(self, query: str, *, limit: int = 10) -> list[DatasetMetadata]:
-        data = self._load_items()
-        rx = re.compile(re.escape(query), re.IGNORECASE)
-        feats = data.get("features") or []
-        results: list[tuple[int, DatasetMetadata]] = []
+        cols = self._load_columns()
+        q = query.lower()
         w = self.weights or {}
-        for f in feats:
-            props = f.get("properties") or {}
-            title = str(props.get("title") or "")
-            desc = str(props.get("description") or "")
-            links = f.get("links") or props.get("links") or []
-            # Score
+        w_title = int(w.get("title", 3))
+        w_desc = int(w.get("description", 2))
+        w_links = int(w.get("link_titles", 1))
+        w_id = int(w.get("id", 1))
+        w_kw = int(w.get("keywords", 1))
+        w_generic = int(w.get("generic_props", 1))
+        # Score every row in one pass; only keep (score, name, row) tuples
+        hits: list[tuple[int, str, int]] = []
+        for i, title_l in enumerate(cols.titles_lower):
             score = 0
-            if rx.search(title):
-                score += int(w.get("title", 3))
-            if rx.search(desc):
-                score += int(w.get("description", 2))
-            # Fallback: scan link titles
-            for ln in links:
-                lt = str(ln.get("title") or "")
-                if lt and rx.search(lt):
-                    score += int(w.get("link_titles", 1))
-                    break
-            # Broader scan: feature id and generic properties (strings/lists of strings)
-            fid = str(f.get("id") or "")
-            if fid and rx.search(fid):
-                score += int(w.get("id", 1))
-            # Keywords array (commonly used)
-            kws = props.get("keywords")
-            if isinstance(kws, list) and any(
-                isinstance(k, str) and rx.search(k) for k in kws
-            ):
-                score += int(w.get("keywords", 1))
-            # Generic property values
-            for k, v in props.items():
-                if k in {"title", "description", "keywords", "links"}:
-                    continue
-                if isinstance(v, str) and rx.search(v):
-                    score += int(w.get("generic_props", 1))
-                    break
-                if isinstance(v, list) and any(
-                    isinstance(x, str) and rx.search(x) for x in v
-                ):
-                    score += int(w.get("generic_props", 1))
-                    break
+            if q in title_l:
+                score += w_title
+            if q in cols.descriptions_lower[i]:
+                score += w_desc
+            if any(q in lt for lt in cols.link_titles_lower[i]):
+                score += w_links
+            fid = cols.ids_lower[i]
+            if fid and q in fid:
+                score += w_id
+            if any(q in k for k in cols.keywords_lower[i]):
+                score += w_kw
+            if any(q in v for v in cols.props_lower[i]):
+                score += w_generic
             if score <= 0:
                 continue
-            # Choose a representative URI: first self or data link
-            uri = None
-            for ln in links:
-                rel = (ln.get("rel") or "").lower()
-                href = ln.get("href")
-                if rel in {"self", "data", "collection", "items"} and href:
-                    uri = href
-                    break
-            if not uri:
-                # Default to endpoint
-                uri = self.endpoint
+            uri = cols.uris[i] or self.endpoint
+            hits.append((score, cols.titles[i] or uri, i))
+        hits.sort(key=lambda t: (-t[0], t[1]))
+        # Materialize DatasetMetadata only for the rows that are returned
+        results: list[DatasetMetadata] = []
+        for _, name, i in hits[: max(0, limit) or None]:
+            title = cols.titles[i]
+            desc = cols.descriptions[i]
+            uri = cols.uris[i] or self.endpoint
             results.append(
-                (
-                    score,
-                    DatasetMetadata(
-                        id=_slug(title or uri),
-                        name=title or uri,
-                        description=(desc or None),
-                        source="ogc-records",
-                        format="OGC",
-                        uri=uri,
-                    ),
+                DatasetMetadata(
+                    id=_slug(title or uri),
+                    name=name,
+                    description=(desc or None),
+                    source="ogc-records",
+                    format="OGC",
+                    uri=uri,
                 )
             )
-        results.sort(key=lambda t: (-t[0], t[1].name))
-        return [d for _, d in results[: max(0, limit) or None]]
+        return results
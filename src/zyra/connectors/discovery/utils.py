@@ -8,6 +8,13 @@ consistent across CLI and API layers.
 from __future__ import annotations
 
 import re
+from importlib import resources as importlib_resources
+from typing import Any
+
+try:  # Optional C JSON parser; accepts bytes directly and returns plain dicts
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - env dependent
+    from json import loads as json_loads
 
 
 def slugify(s: str) -> str:
@@ -18,6 +25,12 @@ def slugify(s: str) -> str:
     return re.sub(r"\W+", "-", s).strip("-").lower()
 
 
+def load_bundled_profile(name: str) -> dict[str, Any]:
+    """Return the parsed bundled profile ``zyra.assets.profiles/<name>.json``."""
+    path = importlib_resources.files("zyra.assets.profiles").joinpath(f"{name}.json")
+    return json_loads(path.read_bytes())
+
+
 def compute_inclusion(
     ogc_wms: object,
     ogc_records: object,
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import concurrent.futures as _fut
 import contextlib
+import functools
 import re
+import threading
+import time
 from dataclasses import asdict
 from typing import Any, Iterable, Protocol
 
@@ -150,6 +153,75 @@ class ShallowEnricher:
         return enr
 
 
+# Parsed WMS capabilities per endpoint: key -> (expires_at, layer table).
+# Items from the same service differ only by layer, so caching the parsed
+# table lets them skip both the fetch and the XML walk.
+_WMSLayers = dict[str, tuple[str, list[float] | None]]
+_WMS_LAYERS_CACHE: dict[str, tuple[float, _WMSLayers]] = {}
+_WMS_LAYERS_LOCK = threading.Lock()
+
+
+def _cached_layers(key: str) -> _WMSLayers | None:
+    with _WMS_LAYERS_LOCK:
+        hit = _WMS_LAYERS_CACHE.get(key)
+        if hit is None:
+            return None
+        if hit[0] < time.monotonic():
+            del _WMS_LAYERS_CACHE[key]
+            return None
+        return hit[1]
+
+
+def _store_layers(key: str, layers: _WMSLayers, ttl: float) -> None:
+    with _WMS_LAYERS_LOCK:
+        _WMS_LAYERS_CACHE[key] = (time.monotonic() + ttl, layers)
+
+
+def _wms_layer_bbox(layer: Any) -> list[float] | None:
+    for child in list(layer):
+        tag = getattr(child, "tag", "")
+        if isinstance(tag, str) and (
+            tag.endswith("EX_GeographicBoundingBox")
+            or tag.endswith("LatLonBoundingBox")
+        ):
+            try:
+                if tag.endswith("EX_GeographicBoundingBox"):
+                    west = float(_findtext(child, "westBoundLongitude") or "nan")
+                    east = float(_findtext(child, "eastBoundLongitude") or "nan")
+                    south = float(_findtext(child, "southBoundLatitude") or "nan")
+                    north = float(_findtext(child, "northBoundLatitude") or "nan")
+                    return [west, south, east, north]
+                minx = float(child.get("minx"))
+                miny = float(child.get("miny"))
+                maxx = float(child.get("maxx"))
+                maxy = float(child.get("maxy"))
+                return [minx, miny, maxx, maxy]
+            except Exception:
+                return None
+    return None
+
+
+def _wms_layer_table(root: Any) -> _WMSLayers:
+    """Map each layer Title and Name to ``(variable name, bbox)``.
+
+    The first layer in document order wins for a given Title/Name, matching
+    a top-down search for the item's layer.
+    """
+    table: _WMSLayers = {}
+    for node in root.iter():
+        if not (isinstance(node.tag, str) and node.tag.endswith("Layer")):
+            continue
+        title = _findtext(node, "Title") or ""
+        name = _findtext(node, "Name") or ""
+        if not (title or name):
+            continue
+        entry = (title or name, _wms_layer_bbox(node))
+        for label in (title, name):
+            if label:
+                table.setdefault(label, entry)
+    return table
+
+
 class WMSCapabilitiesEnricher:
     name = "wms-capabilities"
 
@@ -169,20 +241,24 @@ class WMSCapabilitiesEnricher:
         allow = list(ctx.get("allow_hosts") or []) if ctx else []
         deny = list(ctx.get("deny_hosts") or []) if ctx else []
         req_timeout = float(ctx.get("timeout") or 3.0)
+        cache_ttl = ctx.get("cache_ttl") if ctx else None
+        ttl = float(86400 if cache_ttl is None else cache_ttl)
         import xml.etree.ElementTree as ET
 
-        def _load_xml(uri: str) -> ET.Element | None:
+        def _load_layers(uri: str) -> _WMSLayers | None:
             from pathlib import Path
 
             try:
-                if uri.startswith("file:"):
-                    path = Path(uri[5:])
-                    with path.open(encoding="utf-8") as f:
-                        return ET.fromstring(f.read())
-                p = Path(uri)
-                if p.exists():
-                    with p.open(encoding="utf-8") as f:
-                        return ET.fromstring(f.read())
+                path = Path(uri[5:]) if uri.startswith("file:") else Path(uri)
+                if uri.startswith("file:") or path.exists():
+                    # Key local documents by path and mtime so edits are seen
+                    key = f"{path.resolve()}|{path.stat().st_mtime_ns}"
+                    layers = _cached_layers(key)
+                    if layers is None:
+                        with path.open(encoding="utf-8") as f:
+                            layers = _wms_layer_table(ET.fromstring(f.read()))
+                        _store_layers(key, layers, ttl)
+                    return layers
             except Exception:
                 return None
             if offline:
@@ -197,67 +273,34 @@ class WMSCapabilitiesEnricher:
                     return None
             except Exception:
                 return None
+            layers = _cached_layers(url)
+            if layers is not None:
+                return layers
             try:
                 import requests  # type: ignore
 
                 # Use configured/request timeout instead of a hard-coded value
                 r = requests.get(url, timeout=max(1.0, float(req_timeout or 3.0)))
                 r.raise_for_status()
-                return ET.fromstring(r.text)
+                layers = _wms_layer_table(ET.fromstring(r.text))
             except Exception:
                 return None
+            _store_layers(url, layers, ttl)
+            return layers
 
         try:
-            root = _load_xml(item.uri)
-            if root is None:
+            layers = _load_layers(item.uri)
+            if layers is None:
                 return None
-            target_layer = None
-            for node in root.iter():
-                if isinstance(node.tag, str) and node.tag.endswith("Layer"):
-                    title = _findtext(node, "Title") or ""
-                    name = _findtext(node, "Name") or ""
-                    if item.name and (item.name == title or item.name == name):
-                        target_layer = node
-                        break
+            target = layers.get(item.name) if item.name else None
             variables: list[DatasetVariable] = []
-            if target_layer is not None:
-                title = _findtext(target_layer, "Title") or ""
-                name = _findtext(target_layer, "Name") or ""
-                vname = title or name or item.name
-                if vname:
-                    variables.append(DatasetVariable(name=vname))
-                bbox = None
-                for child in list(target_layer):
-                    tag = getattr(child, "tag", "")
-                    if isinstance(tag, str) and (
-                        tag.endswith("EX_GeographicBoundingBox")
-                        or tag.endswith("LatLonBoundingBox")
-                    ):
-                        try:
-                            if tag.endswith("EX_GeographicBoundingBox"):
-                                west = float(
-                                    _findtext(child, "westBoundLongitude") or "nan"
-                                )
-                                east = float(
-                                    _findtext(child, "eastBoundLongitude") or "nan"
-                                )
-                                south = float(
-                                    _findtext(child, "southBoundLatitude") or "nan"
-                                )
-                                north = float(
-                                    _findtext(child, "northBoundLatitude") or "nan"
-                                )
-                                bbox = [west, south, east, north]
-                            else:
-                                minx = float(child.get("minx"))
-                                miny = float(child.get("miny"))
-                                maxx = float(child.get("maxx"))
-                                maxy = float(child.get("maxy"))
-                                bbox = [minx, miny, maxx, maxy]
-                        except Exception:
-                            bbox = None
-                        break
-                spt = SpatialInfo(bbox=bbox, crs="EPSG:4326" if bbox else None)
+            if target is not None:
+                vname, bbox = target
+                variables.append(DatasetVariable(name=vname))
+                spt = SpatialInfo(
+                    bbox=list(bbox) if bbox else bbox,
+                    crs="EPSG:4326" if bbox else None,
+                )
             else:
                 spt = SpatialInfo()
             prov = [
@@ -282,6 +325,41 @@ class WMSCapabilitiesEnricher:
             return None
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_local_json(path: str, mtime_ns: int) -> Any:  # noqa: ARG001 - cache key
+    import json
+    from pathlib import Path
+
+    with Path(path).open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_json_uri(uri: str, *, offline: bool) -> Any:
+    """Load a JSON document from a ``file:`` URI, local path, or URL.
+
+    Local files are parsed once per modification time and the parsed object
+    is shared between calls, so callers must treat it as read-only.
+    """
+    from pathlib import Path
+
+    try:
+        path = Path(uri[5:]) if uri.startswith("file:") else Path(uri)
+        if uri.startswith("file:") or path.exists():
+            return _parse_local_json(str(path.resolve()), path.stat().st_mtime_ns)
+    except Exception:
+        return None
+    if offline:
+        return None
+    try:
+        import requests  # type: ignore
+
+        r = requests.get(uri, timeout=5)
+        r.raise_for_status()
+        return r.json()
+    except Exception:
+        return None
+
+
 class RecordsCapabilitiesEnricher:
     name = "records-capabilities"
 
@@ -297,31 +375,7 @@ class RecordsCapabilitiesEnricher:
         self, item: DatasetMetadata, level: str, ctx: dict[str, Any]
     ) -> DatasetEnrichment | None:
         offline = bool(ctx.get("offline")) if ctx else False
-        import json
-        from pathlib import Path
-
-        def _load_json(uri: str) -> dict[str, Any] | None:
-            try:
-                if uri.startswith("file:"):
-                    p = Path(uri[5:])
-                    return json.loads(p.read_text(encoding="utf-8"))
-                p = Path(uri)
-                if p.exists():
-                    return json.loads(p.read_text(encoding="utf-8"))
-            except Exception:
-                return None
-            if offline:
-                return None
-            try:
-                import requests  # type: ignore
-
-                r = requests.get(uri, timeout=5)
-                r.raise_for_status()
-                return r.json()
-            except Exception:
-                return None
-
-        data = _load_json(item.uri)
+        data = _load_json_uri(item.uri, offline=offline)
         if not data:
             return None
         time_info = None
@@ -401,31 +455,7 @@ class STACCapabilitiesEnricher:
         self, item: DatasetMetadata, level: str, ctx: dict[str, Any]
     ) -> DatasetEnrichment | None:
         offline = bool(ctx.get("offline")) if ctx else False
-        import json
-        from pathlib import Path
-
-        def _load_json(uri: str) -> dict[str, Any] | None:
-            try:
-                if uri.startswith("file:"):
-                    p = Path(uri[5:])
-                    return json.loads(p.read_text(encoding="utf-8"))
-                p = Path(uri)
-                if p.exists():
-                    return json.loads(p.read_text(encoding="utf-8"))
-            except Exception:
-                return None
-            if offline:
-                return None
-            try:
-                import requests  # type: ignore
-
-                r = requests.get(uri, timeout=5)
-                r.raise_for_status()
-                return r.json()
-            except Exception:
-                return None
-
-        data = _load_json(item.uri)
+        data = _load_json_uri(item.uri, offline=offline)
         if not isinstance(data, dict):
             return None
         if not (
@@ -932,7 +962,9 @@ def _cache_key(item: DatasetMetadata, level: str, plugin: str) -> str:
     uri = item.uri or ""
     src = item.source or ""
     fmt = item.format or ""
-    return f"{uri}|{src}|{fmt}|{level}|{plugin}"
+    # Layers of one WMS share a URI, so the item name must be part of the key
+    name = item.name or ""
+    return f"{uri}|{name}|{src}|{fmt}|{level}|{plugin}"
 
 
 def enrich_items(
@@ -961,6 +993,21 @@ def enrich_items(
         DatasetMetadataExtended(**asdict(i)) for i in items_list
     ]
 
+    # Options are identical for every item/enricher pair; assemble them once
+    # and hand each enricher a shallow copy.
+    ctx: dict[str, Any] = {
+        "offline": offline,
+        "https_only": bool(https_only or False),
+        "allow_hosts": list(allow_hosts or []),
+        "deny_hosts": list(deny_hosts or []),
+        "max_probe_bytes": max_probe_bytes,
+        "timeout": timeout,
+        "cache_ttl": cache_ttl,
+        "profile_defaults": dict(profile_defaults or {}),
+        "profile_license_policy": dict(profile_license_policy or {}),
+        "defaults_sources": list(defaults_sources or []),
+    }
+
     def _do_one(ix: int) -> None:
         item = items_list[ix]
         for e in enrs:
@@ -994,21 +1041,7 @@ def enrich_items(
                     out[ix].enrichment = _merge_enrichment(cur, enr)
                     continue
             try:
-                enr = e.enrich(
-                    item,
-                    level,
-                    {
-                        "offline": offline,
-                        "https_only": bool(https_only or False),
-                        "allow_hosts": list(allow_hosts or []),
-                        "deny_hosts": list(deny_hosts or []),
-                        "max_probe_bytes": max_probe_bytes,
-                        "timeout": timeout,
-                        "profile_defaults": dict(profile_defaults or {}),
-                        "profile_license_policy": dict(profile_license_policy or {}),
-                        "defaults_sources": list(defaults_sources or []),
-                    },
-                )
+                enr = e.enrich(item, level, dict(ctx))
             except Exception:
                 enr = None
             if enr:
@@ -1017,7 +1050,16 @@ def enrich_items(
                 with contextlib.suppress(Exception):
                     cache.set(key, asdict(enr), cache_ttl)
 
-    with _fut.ThreadPoolExecutor(max_workers=max(1, int(workers))) as ex:
+    n_workers = min(max(1, int(workers)), len(items_list))
+    if n_workers <= 1:
+        # Nothing to overlap: run inline, skipping thread startup and handoff
+        for i in range(len(items_list)):
+            _do_one(i)
+        return out
+
+    # Enrichers are network-bound; each worker fills its own slot in ``out``
+    # so input order is kept without collecting results.
+    with _fut.ThreadPoolExecutor(max_workers=n_workers) as ex:
         futs = [ex.submit(_do_one, i) for i in range(len(items_list))]
         # Base total timeout scales with item count; apply optional ceiling to avoid excessive waits
         base_total = max(1.0, float(timeout or 0.0)) * max(1, len(items_list)) * 1.5
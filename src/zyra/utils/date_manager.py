@@ -27,6 +27,8 @@ from typing import Iterable
 
 from zyra.utils.env import env_int
 
+_ISO_LIKE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2})?")
+
 
 class DateManager:
     """High-level utilities for working with dates and filenames.
@@ -48,6 +50,9 @@ class DateManager:
     def __init__(self, date_formats: list[str] | None = None) -> None:
         """Optionally store preferred date formats for filename parsing."""
         self.date_formats = date_formats or []
+        # Compiled filename regex per date format; reused across every
+        # filename checked by this instance (listings can be large).
+        self._format_regexes: dict[str, re.Pattern[str]] = {}
         # Throttle repeated parse errors to reduce noisy logs on large listings
         try:
             self._no_date_limit = max(0, env_int("DATE_NO_MATCH_LOG_LIMIT", 50))
@@ -229,18 +234,24 @@ class DateManager:
         # Try configured formats
         for fmt in self.date_formats:
             try:
-                # Build regex from format and search
-                regex = self.datetime_format_to_regex(fmt)
-                m = re.search(regex, string)
+                m = self._format_regex(fmt).search(string)
                 if m:
                     dt = datetime.strptime(m.group(), fmt)
                     return dt.isoformat()
             except Exception:
                 continue
         # Fallback ISO-like pattern
-        match = re.search(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2})?", string)
+        match = _ISO_LIKE_RE.search(string)
         return match.group(0) if match else None
 
+    def _format_regex(self, fmt: str) -> re.Pattern[str]:
+        """Return the compiled filename regex for ``fmt`` (built once)."""
+        rx = self._format_regexes.get(fmt)
+        if rx is None:
+            rx = re.compile(self.datetime_format_to_regex(fmt))
+            self._format_regexes[fmt] = rx
+        return rx
+
     def extract_dates_from_filenames(
         self,
         directory_path: str,
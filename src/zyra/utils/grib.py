@@ -10,15 +10,23 @@ Notes
 - The `.idx` file path is assumed to be the GRIB file path with a `.idx`
   suffix appended, unless a path already ending in `.idx` is provided.
 - Pattern filtering uses regular expressions via :func:`re.search`.
+- Ranged downloads coalesce nearby ranges (see :func:`coalesce_ranges`) so
+  contiguous ``.idx`` records are fetched with one request instead of one
+  request per record.
 """
 
 from __future__ import annotations
 
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from io import BytesIO
 from typing import Callable, Iterable
 
+# Ranges separated by at most this many bytes are fetched as one request.
+COALESCE_MAX_GAP = 64 * 1024
+# Never grow a coalesced request past this span so large chunked downloads
+# (see :func:`compute_chunks`) keep their parallelism.
+COALESCE_MAX_SPAN = 32 * 1024 * 1024
+
 
 def ensure_idx_path(path: str) -> str:
     """Return the `.idx` path for a GRIB file or pass through an explicit idx path.
@@ -37,36 +45,44 @@ def ensure_idx_path(path: str) -> str:
     return path if path.endswith(".idx") else f"{path}.idx"
 
 
-def parse_idx_lines(idx_bytes_or_text: bytes | str) -> list[str]:
+def parse_idx_lines(
+    idx_bytes_or_text: bytes | bytearray | memoryview | str,
+) -> list[str]:
     """Parse a GRIB index payload into non-empty lines.
 
     Parameters
     ----------
-    idx_bytes_or_text : bytes or str
-        Raw `.idx` file content.
+    idx_bytes_or_text : bytes, bytearray, memoryview or str
+        Raw `.idx` file content. Buffers are decoded in place without an
+        intermediate ``bytes`` copy.
 
     Returns
     -------
     list of str
         The non-empty, newline-split lines of the index.
     """
-    if isinstance(idx_bytes_or_text, (bytes, bytearray)):
-        text = idx_bytes_or_text.decode()
-    else:
+    if isinstance(idx_bytes_or_text, str):
         text = idx_bytes_or_text
-    lines = [ln for ln in text.splitlines() if ln]
-    return lines
+    else:
+        text = str(idx_bytes_or_text, "utf-8")
+    # Operational idx files run to tens of thousands of records; filter(None)
+    # drops blank lines without a per-line Python-level test.
+    return list(filter(None, text.splitlines()))
 
 
-def idx_to_byteranges(lines: list[str], search_regex: str) -> dict[str, str]:
+def idx_to_byteranges(
+    lines: list[str], search_regex: str | re.Pattern[str]
+) -> dict[str, str]:
     """Convert `.idx` lines plus a variable regex into HTTP Range headers.
 
     Parameters
     ----------
     lines : list of str
         Lines from a GRIB `.idx` file.
-    search_regex : str
+    search_regex : str or re.Pattern
         Regular expression to select desired GRIB lines (e.g., "PRES:surface").
+        It is matched against the whole line, so patterns may span fields.
+        A precompiled pattern is used as-is.
 
     Returns
     -------
@@ -74,24 +90,31 @@ def idx_to_byteranges(lines: list[str], search_regex: str) -> dict[str, str]:
         Mapping of ``{"bytes=start-end": matching_idx_line}`` suitable for
         use as Range headers.
     """
-    expr = re.compile(search_regex)
+    expr = (
+        search_regex
+        if isinstance(search_regex, re.Pattern)
+        else re.compile(search_regex)
+    )
     byte_ranges: dict[str, str] = {}
-    for n, line in enumerate(lines, start=1):
-        if expr.search(line):
-            parts = line.split(":")
-            if len(parts) < 2:
-                continue
-            rangestart = parts[1]
-            # End is the start of the next record (if present)
-            rangeend = ""
-            if n < len(lines):
-                nxt = lines[n].split(":")
-                if len(nxt) > 1:
-                    try:
-                        rangeend = str(int(nxt[1]) - 1)
-                    except ValueError:
-                        rangeend = nxt[1]
-            byte_ranges[f"bytes={rangestart}-{rangeend}"] = line
+    last = len(lines) - 1
+    for n, line in enumerate(lines):
+        if not expr.search(line):
+            continue
+        # Only the record number and offset are needed: "<num>:<offset>:..."
+        parts = line.split(":", 2)
+        if len(parts) < 2:
+            continue
+        rangestart = parts[1]
+        # End is the start of the next record (if present)
+        rangeend = ""
+        if n < last:
+            nxt = lines[n + 1].split(":", 2)
+            if len(nxt) > 1:
+                try:
+                    rangeend = str(int(nxt[1]) - 1)
+                except ValueError:
+                    rangeend = nxt[1]
+        byte_ranges[f"bytes={rangestart}-{rangeend}"] = line
     return byte_ranges
 
 
@@ -152,20 +175,153 @@ def parallel_download_byteranges(
     bytes
         The concatenated payload of all requested ranges in the input order.
     """
-    # Preserve order by indexing the ranges and reassembling in order.
-    indexed = list(enumerate(byte_ranges))
-    if not indexed:
-        return b""
-    results: dict[int, bytes] = {}
+    # join sizes the output once from the parts; no incremental growth
+    return b"".join(
+        _download_each(
+            download_func, key_or_url, list(byte_ranges), max_workers=max_workers
+        )
+    )
+
+
+def _download_each(
+    download_func: Callable[[str, str], bytes],
+    key_or_url: str,
+    byte_ranges: list[str],
+    *,
+    max_workers: int,
+) -> list[bytes]:
+    """Fetch each range in parallel and return the payloads in input order."""
+    if not byte_ranges:
+        return []
+    results: list[bytes] = [b""] * len(byte_ranges)
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_map = {
-            executor.submit(download_func, key_or_url, rng): idx for idx, rng in indexed
+            executor.submit(download_func, key_or_url, rng): idx
+            for idx, rng in enumerate(byte_ranges)
         }
         for fut in as_completed(future_map):
-            idx = future_map[fut]
-            results[idx] = fut.result() or b""
+            results[future_map[fut]] = fut.result() or b""
+    return results
+
+
+def parse_byterange(range_header: str) -> tuple[int, int | None] | None:
+    """Parse ``"bytes=start-end"`` into ``(start, end)``.
+
+    ``end`` is ``None`` for open-ended ranges (``"bytes=100-"``). Returns
+    ``None`` for forms that cannot be coalesced, such as suffix ranges
+    (``"bytes=-500"``) or multi-range headers.
+    """
+    spec = range_header.strip()
+    if spec.startswith("bytes="):
+        spec = spec[len("bytes=") :]
+    start_s, sep, end_s = spec.partition("-")
+    if not sep or not start_s or "," in spec:
+        return None
+    try:
+        start = int(start_s)
+        end = int(end_s) if end_s else None
+    except ValueError:
+        return None
+    if end is not None and end < start:
+        return None
+    return start, end
+
+
+def coalesce_ranges(
+    ranges: Iterable[tuple[int, int | None]],
+    max_gap: int = COALESCE_MAX_GAP,
+    *,
+    max_span: int = COALESCE_MAX_SPAN,
+) -> list[tuple[int, int | None]]:
+    """Merge overlapping or nearby inclusive byte ranges.
+
+    Parameters
+    ----------
+    ranges : Iterable of (start, end)
+        Inclusive byte ranges; ``end`` may be ``None`` for "to end of file".
+    max_gap : int, default 64 KiB
+        Ranges whose gap (bytes between them) is at most this are merged.
+    max_span : int, default 32 MiB
+        Upper bound on the size of a merged range. Ranges that already
+        exceed it (e.g., large download chunks) are left as-is.
+
+    Returns
+    -------
+    list of (start, end)
+        Sorted, merged ranges covering every input range.
+    """
+    return _coalesce_spans(list(ranges), max_gap, max_span)[0]
+
+
+def _coalesce_spans(
+    spans: list[tuple[int, int | None]], max_gap: int, max_span: int
+) -> tuple[list[tuple[int, int | None]], list[int]]:
+    """Merge ``spans`` and report which merged group holds each input span.
+
+    Returns ``(groups, owner)`` where ``groups[owner[i]]`` contains
+    ``spans[i]``. Groups may share a start offset when ``max_span`` blocks a
+    merge, so the owner must be recorded rather than looked up by offset.
+    """
+    merged: list[tuple[int, int | None]] = []
+    owner = [0] * len(spans)
+    for i in sorted(range(len(spans)), key=lambda k: spans[k][0]):
+        start, end = spans[i]
+        if merged:
+            m_start, m_end = merged[-1]
+            if m_end is None:
+                owner[i] = len(merged) - 1
+                continue
+            if start - m_end - 1 <= max_gap:
+                new_end = None if end is None else max(m_end, end)
+                span_end = m_end if new_end is None else new_end
+                if span_end - m_start + 1 <= max_span:
+                    merged[-1] = (m_start, new_end)
+                    owner[i] = len(merged) - 1
+                    continue
+        merged.append((start, end))
+        owner[i] = len(merged) - 1
+    return merged, owner
 
-    buf = BytesIO()
-    for idx, _ in indexed:
-        buf.write(results.get(idx, b""))
-    return buf.getvalue()
+
+def coalesced_download_byteranges(
+    download_func: Callable[[str, str], bytes],
+    key_or_url: str,
+    byte_ranges: Iterable[str],
+    *,
+    max_workers: int = 10,
+    max_gap: int | None = COALESCE_MAX_GAP,
+    max_span: int = COALESCE_MAX_SPAN,
+) -> bytes:
+    """Like :func:`parallel_download_byteranges`, but coalesce nearby ranges.
+
+    Nearby ranges are merged with :func:`coalesce_ranges` (no merged range
+    grows past ``max_span`` bytes), each merged range is fetched once, and the
+    payload is sliced back into the requested ranges and concatenated in the
+    input order. Pass ``max_gap=None`` (or ranges that cannot be parsed) to
+    fetch every range as given.
+    """
+    requested = list(byte_ranges)
+    parsed = [parse_byterange(r) for r in requested]
+    if max_gap is None or len(requested) < 2 or any(p is None for p in parsed):
+        return parallel_download_byteranges(
+            download_func, key_or_url, requested, max_workers=max_workers
+        )
+    spans = [p for p in parsed if p is not None]
+    groups, owner = _coalesce_spans(spans, max_gap, max_span)
+    if len(groups) == len(requested):
+        return parallel_download_byteranges(
+            download_func, key_or_url, requested, max_workers=max_workers
+        )
+    headers = [f"bytes={s}-{'' if e is None else e}" for s, e in groups]
+    blobs = [
+        memoryview(b)
+        for b in _download_each(
+            download_func, key_or_url, headers, max_workers=max_workers
+        )
+    ]
+    parts: list[memoryview] = []
+    for (start, end), gi in zip(spans, owner):
+        off = start - groups[gi][0]
+        blob = blobs[gi]
+        parts.append(blob[off:] if end is None else blob[off : off + end - start + 1])
+    return b"".join(parts)
@@ -296,6 +296,20 @@ def _handle_animate_impl(ns) -> int:
     return 0
 
 
+def _xstack_layout(n: int, cols: int) -> str:
+    """Return the xstack layout for ``n`` tiles in rows of ``cols``.
+
+    Positions use the first input's dimensions (w0,h0) as the tile size.
+    """
+    entries = []
+    for idx in range(n):
+        r, c = divmod(idx, cols)
+        x = "0" if c == 0 else f"w0*{c}"
+        y = "0" if r == 0 else f"h0*{r}"
+        entries.append(f"{x}_{y}")
+    return "|".join(entries)
+
+
 def _build_ffmpeg_grid_args(
     *, videos: list[str], fps: int, output: str, grid_mode: str, cols: int
 ) -> list[str]:
@@ -350,15 +364,9 @@ def _build_ffmpeg_grid_args(
     if grid_mode == "hstack":
         filter_desc = f"hstack=inputs={len(videos)}"
     else:
-        # Build xstack layout using first input dimensions (w0,h0) as tile size.
-        layout_entries: list[str] = []
-        for idx in range(len(videos)):
-            r = idx // cols
-            c = idx % cols
-            x = "0" if c == 0 else f"w0*{c}"
-            y = "0" if r == 0 else f"h0*{r}"
-            layout_entries.append(f"{x}_{y}")
-        filter_desc = f"xstack=inputs={len(videos)}:layout=" + "|".join(layout_entries)
+        filter_desc = (
+            f"xstack=inputs={len(videos)}:layout={_xstack_layout(len(videos), cols)}"
+        )
     args.extend(
         [
             "-filter_complex",
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Fixtures shared across test directories.
+
+Spawning ``python -m zyra.cli`` per call pays interpreter startup plus the
+package import every time. ``run_cli`` calls :func:`zyra.cli.main` directly
+and returns a ``subprocess.CompletedProcess``-like namespace so assertions
+on ``returncode``/``stdout``/``stderr`` read the same (as bytes).
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import sys
+import types
+
+import pytest
+
+# Headless backend for every test and the CLI subprocesses they spawn. Set
+# before matplotlib is first imported so no GUI backend gets probed.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _enrich_cache_dir(tmp_path_factory):
+    """Keep the enrichment cache out of the checkout.
+
+    ``zyra.utils.simple_cache`` defaults to ``.cache/zyra_enrich`` under the
+    cwd, which parallel workers would race on; each session (one per xdist
+    worker) gets its own directory instead. Tests that need a specific cache
+    still override ``ZYRA_CACHE_DIR`` with monkeypatch.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ZYRA_CACHE_DIR", str(tmp_path_factory.mktemp("zyra_enrich")))
+        yield
+
+
+@pytest.fixture
+def run_cli(monkeypatch, capsysbinary):
+    from zyra.cli import main
+
+    def _run(args, input_bytes: bytes | None = None):
+        monkeypatch.setattr(
+            sys, "stdin", io.TextIOWrapper(io.BytesIO(input_bytes or b""))
+        )
+        capsysbinary.readouterr()
+        # The runner exports verbosity/strict-env flags; a child process would
+        # not leak them back, so neither may an in-process call.
+        saved_env = os.environ.copy()
+        # A child's logging.basicConfig() would send log records to its
+        # stderr; here pytest's capture handlers make basicConfig a no-op,
+        # so route records to the captured stderr for the call instead.
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            rc = main(list(args))
+        except SystemExit as exc:
+            if isinstance(exc.code, int) or exc.code is None:
+                rc = exc.code or 0
+            else:
+                sys.stderr.write(f"{exc.code}\n")
+                rc = 1
+        finally:
+            root.removeHandler(handler)
+            os.environ.clear()
+            os.environ.update(saved_env)
+        out, err = capsysbinary.readouterr()
+        return types.SimpleNamespace(returncode=rc, stdout=out, stderr=err)
+
+    return _run
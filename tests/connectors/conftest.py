@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Shared protocol fakes for connector backend tests.
+
+Backend tests used to define their own ``ftplib.FTP`` stand-in per test with
+the same no-op connect/login/quit boilerplate. ``fake_ftp_class`` provides one
+in-memory base class; tests subclass it and override only what they exercise
+(e.g., ``nlst`` or ``retrbinary``), then patch it in as
+``zyra.connectors.backends.ftp.FTP``.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from ftplib import error_perm
+
+import pytest
+
+
+class FakeFTP:
+    """In-memory ``ftplib.FTP`` stand-in serving ``files`` by absolute path."""
+
+    files: dict[str, bytes] = {}
+    # MDTM reply timestamp; None behaves like a server without MDTM support
+    mdtm: str | None = None
+
+    def __init__(self, timeout=30):
+        self.timeout = timeout
+        self.cwd_path = "/"
+
+    def connect(self, host, port=None):
+        return None
+
+    def login(self, user=None, passwd=None):
+        return None
+
+    def set_pasv(self, flag):
+        return None
+
+    def quit(self):
+        return None
+
+    def abort(self):
+        return None
+
+    def cwd(self, d):
+        if not d.startswith("/"):
+            d = "/" + d
+        self.cwd_path = d
+
+    def _path(self, filename):
+        return self.cwd_path.rstrip("/") + "/" + filename
+
+    def nlst(self, d=None):
+        prefix = self.cwd_path.rstrip("/") + "/"
+        return [p[len(prefix) :] for p in self.files if p.startswith(prefix)]
+
+    def size(self, filename):
+        path = self._path(filename)
+        if path not in self.files:
+            raise error_perm(f"550 {filename}: No such file")
+        return len(self.files[path])
+
+    def sendcmd(self, cmd):
+        if self.mdtm is None:
+            raise error_perm("500 MDTM not understood")
+        return f"213 {self.mdtm}"
+
+    def retrbinary(self, cmd, callback, blocksize=8192, rest=None):
+        _, fname = cmd.split()
+        data = self.files[self._path(fname)]
+        start = int(rest) if rest is not None else 0
+        view = memoryview(data)[start:]
+        step = min(blocksize, len(view)) or 1
+        for i in range(0, len(view), step):
+            callback(view[i : i + step].tobytes())
+
+    def voidresp(self):
+        # Final reply after a transfer the client closed early
+        return "226 Transfer complete"
+
+
+@pytest.fixture(scope="session")
+def local_catalog():
+    """One packaged-catalog backend shared by the read-only search tests."""
+    from zyra.connectors.discovery import LocalCatalogBackend
+
+    return LocalCatalogBackend()
+
+
+@pytest.fixture(scope="session")
+def fake_ftp_class():
+    """Return the shared :class:`FakeFTP` base class."""
+    return FakeFTP
+
+
+@pytest.fixture
+def fake_requests_module(monkeypatch):
+    """Install a ``requests`` stand-in exposing only the given functions.
+
+    Returns an installer: ``fake_requests_module(get=..., head=...)`` puts a
+    namespace with those callables in ``sys.modules['requests']`` for the
+    rest of the test and returns it.
+    """
+
+    def _install(**methods):
+        fake = types.SimpleNamespace(**methods)
+        monkeypatch.setitem(sys.modules, "requests", fake)
+        return fake
+
+    return _install
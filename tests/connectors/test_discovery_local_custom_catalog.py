@@ -33,3 +33,28 @@ def test_local_catalog_from_file(tmp_path):
     # Ensure path override worked by checking both items are discoverable via keywords
     res2 = b.search("temperature", limit=5)
     assert any("Bar" in d.name for d in res2)
+
+
+def test_local_catalog_index_keeps_substring_matching(tmp_path):
+    data = [
+        {
+            "url": "https://example.com/datasets/waves/",
+            "title": "Ocean Waves",
+            "description": "Modeled wave heights",
+            "keywords": ["Tsunamis"],
+        },
+        {
+            "url": "https://example.com/datasets/sst/",
+            "title": "Sea Surface Temperature",
+            "description": "Daily SST analysis",
+            "keywords": ["Oceans"],
+        },
+    ]
+    p = tmp_path / "catalog.json"
+    p.write_text(json.dumps(data), encoding="utf-8")
+
+    b = LocalCatalogBackend(str(p))
+    # Query tokens match inside longer words, case-insensitively
+    assert [d.id for d in b.search("TSUNAMI")] == ["waves"]
+    # Multi-token queries score each token; title hits rank first
+    assert [d.id for d in b.search("ocean temperature")] == ["sst", "waves"]
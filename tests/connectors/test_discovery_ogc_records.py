@@ -52,3 +52,20 @@ def test_ogc_records_search_matches_properties():
     assert any(
         d.uri.endswith("/collections/temp/items") or "items" in d.uri for d in items
     )
+
+
+def test_ogc_records_parses_once_and_ranks_by_score():
+    import json
+
+    backend = OGCRecordsBackend(
+        endpoint="https://example.com/collections",
+        items_json=json.dumps(SAMPLE_RECORDS),
+    )
+    first = backend.search("precip", limit=5)
+    # Payload is parsed once; later searches reuse the columnar view
+    backend.items_json = "not json"
+    second = backend.search("PRECIP", limit=5)
+    assert [d.name for d in first] == [d.name for d in second] == ["Precipitation"]
+    assert second[0].uri == "https://example.com/collections/precip/items"
+    assert backend.search("global", limit=0) != []
+    assert len(backend.search("e", limit=1)) == 1
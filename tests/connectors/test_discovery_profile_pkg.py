@@ -9,3 +9,20 @@ def test_local_catalog_pkg_reference_loads_asset():
     items = b.search("tsunami", limit=3)
     assert isinstance(items, list)
     assert 1 <= len(items) <= 3
+
+
+def test_local_catalog_pkg_loads_are_shared_until_reset():
+    from zyra.connectors.discovery import reset_catalog_cache
+
+    ref = "pkg:zyra.assets.metadata/sos_dataset_metadata.json"
+    a = LocalCatalogBackend(ref)
+    b = LocalCatalogBackend(ref)
+    a.search("tsunami", limit=1)
+    b.search("tsunami", limit=1)
+    assert a._cache is b._cache
+    assert a._index is b._index
+    reset_catalog_cache()
+    c = LocalCatalogBackend(ref)
+    c.search("tsunami", limit=1)
+    assert c._cache is not a._cache
+    assert c._cache == a._cache
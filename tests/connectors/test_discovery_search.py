@@ -3,12 +3,9 @@ from __future__ import annotations
 
 import re
 
-from zyra.connectors.discovery import LocalCatalogBackend
 
-
-def test_local_catalog_search_basic_results():
-    backend = LocalCatalogBackend()
-    items = backend.search("tsunami", limit=5)
+def test_local_catalog_search_basic_results(local_catalog):
+    items = local_catalog.search("tsunami", limit=5)
     assert 1 <= len(items) <= 5
     for d in items:
         assert d.id and isinstance(d.id, str)
@@ -17,9 +14,8 @@ def test_local_catalog_search_basic_results():
         assert d.uri.startswith("ftp://") or d.uri.startswith("http")
 
 
-def test_local_catalog_search_limit_and_matching():
-    backend = LocalCatalogBackend()
-    items = backend.search("earthquake", limit=2)
+def test_local_catalog_search_limit_and_matching(local_catalog):
+    items = local_catalog.search("earthquake", limit=2)
     assert len(items) <= 2
     # Ensure the term appears in at least one of the fields used for scoring
     rx = re.compile("earthquake", re.IGNORECASE)
@@ -43,3 +43,47 @@ def test_wms_capabilities_extract_bbox_latlon(tmp_path):
     assert spt is not None
     assert spt.crs == "EPSG:4326"
     assert spt.bbox == [10.0, -5.0, 20.0, 15.0]
+
+
+def test_wms_capabilities_parsed_once_per_endpoint(tmp_path, monkeypatch):
+    import zyra.transform.enrich as enrich_mod
+
+    monkeypatch.setenv("ZYRA_CACHE_DIR", str(tmp_path / "cache"))
+    caps = tmp_path / "caps.xml"
+    caps.write_text(
+        "<WMS_Capabilities><Capability><Layer><Title>Root</Title>"
+        "<Layer><Title>A</Title><Name>a</Name>"
+        '<LatLonBoundingBox minx="0" miny="1" maxx="2" maxy="3"/></Layer>'
+        "<Layer><Title>B</Title><Name>b</Name>"
+        '<LatLonBoundingBox minx="4" miny="5" maxx="6" maxy="7"/></Layer>'
+        "</Layer></Capability></WMS_Capabilities>",
+        encoding="utf-8",
+    )
+    calls = []
+    real_table = enrich_mod._wms_layer_table
+
+    def _counting_table(root):
+        calls.append(root)
+        return real_table(root)
+
+    monkeypatch.setattr(enrich_mod, "_wms_layer_table", _counting_table)
+    items = [
+        DatasetMetadata(
+            id=name,
+            name=name,
+            description=None,
+            source="ogc-wms",
+            format="WMS",
+            uri=f"file:{caps}",
+        )
+        for name in ("A", "b")
+    ]
+    out = enrich_items(
+        items, level="capabilities", timeout=1.0, workers=1, cache_ttl=10, offline=True
+    )
+    assert [o.enrichment.spatial.bbox for o in out] == [
+        [0.0, 1.0, 2.0, 3.0],
+        [4.0, 5.0, 6.0, 7.0],
+    ]
+    assert [v.name for v in out[1].enrichment.variables] == ["B"]
+    assert len(calls) == 1
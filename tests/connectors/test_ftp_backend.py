@@ -56,24 +56,9 @@ def test_parse_ftp_path_no_warning_when_values_match():
     assert (user, pwd) == ("urluser", "urlpass")
 
 
-def test_list_files_with_date_filter_and_credentials(monkeypatch):
+def test_list_files_with_date_filter_and_credentials(monkeypatch, fake_ftp_class):
     # Mock ftplib FTP.nlst
-    class _FTP:
-        def __init__(self, timeout=30):
-            self.timeout = timeout
-
-        def connect(self, host):
-            return None
-
-        def login(self, user=None, passwd=None):
-            return None
-
-        def set_pasv(self, flag):
-            return None
-
-        def cwd(self, d):
-            return None
-
+    class _FTP(fake_ftp_class):
         def nlst(self):
             return [
                 "/SOS/DroughtRisk_Weekly/DroughtRisk_Weekly_20240101.png",
@@ -90,38 +75,20 @@ def test_list_files_with_date_filter_and_credentials(monkeypatch):
         assert names and all("2025" in n for n in names)
 
 
-def test_sync_directory_cleans_zero_byte(tmp_path):
+def test_sync_directory_cleans_zero_byte(tmp_path, fake_ftp_class):
     # Create a zero-byte file and verify it gets removed with clean_zero_bytes
     d = tmp_path / "frames"
     d.mkdir()
     fz = d / "z.png"
     fz.write_bytes(b"")
 
-    class _FTP2:
-        def __init__(self, timeout=30):
-            pass
-
-        def connect(self, host):
-            return None
-
-        def login(self, user=None, passwd=None):
-            return None
-
-        def set_pasv(self, flag):
-            return None
-
-        def cwd(self, d):
-            return None
-
+    class _FTP2(fake_ftp_class):
         def nlst(self):
             return ["a.png"]
 
         def retrbinary(self, cmd, cb):
             cb(b"x")
 
-        def quit(self):
-            return None
-
     with patch("zyra.connectors.backends.ftp.FTP", _FTP2):
         ftp_backend.sync_directory("ftp://host/dir", str(d), clean_zero_bytes=True)
         assert not fz.exists()
@@ -375,63 +342,27 @@ class TestShouldDownload:
 class TestGetRemoteMtime:
     """Tests for get_remote_mtime function."""
 
-    def test_get_remote_mtime_success(self, monkeypatch):
+    def test_get_remote_mtime_success(self, monkeypatch, fake_ftp_class):
         """MDTM response is parsed correctly."""
 
-        class _FTPMdtm:
-            def __init__(self, timeout=30):
-                pass
-
-            def connect(self, host):
-                return None
-
-            def login(self, user=None, passwd=None):
-                return None
-
-            def set_pasv(self, flag):
-                return None
-
-            def cwd(self, d):
-                return None
-
+        class _FTPMdtm(fake_ftp_class):
             def sendcmd(self, cmd):
                 return "213 20240615120000"  # 2024-06-15 12:00:00
 
-            def quit(self):
-                return None
-
         with patch("zyra.connectors.backends.ftp.FTP", _FTPMdtm):
             result = ftp_backend.get_remote_mtime("ftp://host/path/file.txt")
             from datetime import datetime, timezone
 
             assert result == datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
 
-    def test_get_remote_mtime_not_supported(self, monkeypatch):
+    def test_get_remote_mtime_not_supported(self, monkeypatch, fake_ftp_class):
         """MDTM not supported returns None gracefully."""
         from ftplib import error_perm
 
-        class _FTPNoMdtm:
-            def __init__(self, timeout=30):
-                pass
-
-            def connect(self, host):
-                return None
-
-            def login(self, user=None, passwd=None):
-                return None
-
-            def set_pasv(self, flag):
-                return None
-
-            def cwd(self, d):
-                return None
-
+        class _FTPNoMdtm(fake_ftp_class):
             def sendcmd(self, cmd):
                 raise error_perm("500 MDTM not understood")
 
-            def quit(self):
-                return None
-
         with patch("zyra.connectors.backends.ftp.FTP", _FTPNoMdtm):
             result = ftp_backend.get_remote_mtime("ftp://host/path/file.txt")
             assert result is None
@@ -440,29 +371,14 @@ class TestGetRemoteMtime:
 class TestSyncDirectoryWithOptions:
     """Tests for sync_directory with SyncOptions."""
 
-    def test_sync_directory_with_overwrite_existing(self, tmp_path):
+    def test_sync_directory_with_overwrite_existing(self, tmp_path, fake_ftp_class):
         """sync_directory respects overwrite_existing option."""
         d = tmp_path / "frames"
         d.mkdir()
         existing = d / "file.png"
         existing.write_bytes(b"old content")
 
-        class _FTPSync:
-            def __init__(self, timeout=30):
-                pass
-
-            def connect(self, host):
-                return None
-
-            def login(self, user=None, passwd=None):
-                return None
-
-            def set_pasv(self, flag):
-                return None
-
-            def cwd(self, path):
-                return None
-
+        class _FTPSync(fake_ftp_class):
             def nlst(self):
                 return ["file.png"]
 
@@ -475,16 +391,13 @@ class TestSyncDirectoryWithOptions:
             def retrbinary(self, cmd, cb):
                 cb(b"new content")
 
-            def quit(self):
-                return None
-
         sync_opts = ftp_backend.SyncOptions(overwrite_existing=True)
         with patch("zyra.connectors.backends.ftp.FTP", _FTPSync):
             ftp_backend.sync_directory("ftp://host/dir", str(d), sync_options=sync_opts)
             # File should be replaced with new content
             assert existing.read_bytes() == b"new content"
 
-    def test_sync_directory_skip_with_done_marker(self, tmp_path):
+    def test_sync_directory_skip_with_done_marker(self, tmp_path, fake_ftp_class):
         """sync_directory skips files with .done markers."""
         d = tmp_path / "frames"
         d.mkdir()
@@ -495,22 +408,7 @@ class TestSyncDirectoryWithOptions:
 
         download_called = []
 
-        class _FTPSkip:
-            def __init__(self, timeout=30):
-                pass
-
-            def connect(self, host):
-                return None
-
-            def login(self, user=None, passwd=None):
-                return None
-
-            def set_pasv(self, flag):
-                return None
-
-            def cwd(self, path):
-                return None
-
+        class _FTPSkip(fake_ftp_class):
             def nlst(self):
                 return ["done_file.png"]
 
@@ -522,9 +420,6 @@ class TestSyncDirectoryWithOptions:
                 download_called.append(cmd)
                 cb(b"new content")
 
-            def quit(self):
-                return None
-
         sync_opts = ftp_backend.SyncOptions(skip_if_local_done=True)
         with patch("zyra.connectors.backends.ftp.FTP", _FTPSkip):
             ftp_backend.sync_directory("ftp://host/dir", str(d), sync_options=sync_opts)
@@ -532,7 +427,9 @@ class TestSyncDirectoryWithOptions:
             assert len(download_called) == 0
             assert existing.read_bytes() == b"original"
 
-    def test_sync_directory_preserves_done_markers_during_cleanup(self, tmp_path):
+    def test_sync_directory_preserves_done_markers_during_cleanup(
+        self, tmp_path, fake_ftp_class
+    ):
         """sync_directory cleanup preserves .done marker files."""
         d = tmp_path / "frames"
         d.mkdir()
@@ -543,22 +440,7 @@ class TestSyncDirectoryWithOptions:
         done_marker = d / "old_file.png.done"
         done_marker.write_text("processed")
 
-        class _FTPCleanup:
-            def __init__(self, timeout=30):
-                pass
-
-            def connect(self, host):
-                return None
-
-            def login(self, user=None, passwd=None):
-                return None
-
-            def set_pasv(self, flag):
-                return None
-
-            def cwd(self, path):
-                return None
-
+        class _FTPCleanup(fake_ftp_class):
             def nlst(self):
                 # Remote only has new_file.png, not old_file.png
                 return ["new_file.png"]
@@ -572,9 +454,6 @@ class TestSyncDirectoryWithOptions:
             def retrbinary(self, cmd, cb):
                 cb(b"new content")
 
-            def quit(self):
-                return None
-
         with patch("zyra.connectors.backends.ftp.FTP", _FTPCleanup):
             ftp_backend.sync_directory("ftp://host/dir", str(d))
             # Orphan file should be deleted (not on remote)
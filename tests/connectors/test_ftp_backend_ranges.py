@@ -1,59 +1,24 @@
 # SPDX-License-Identifier: Apache-2.0
 from unittest.mock import patch
 
+import pytest
+
 from zyra.connectors.backends import ftp as ftp_backend
 
 
-class FakeFTP:
-    def __init__(self, timeout=30):
-        self.timeout = timeout
-        self.cwd_path = "/"
-        self.files = {
+@pytest.fixture
+def grib_ftp(fake_ftp_class):
+    class GribFTP(fake_ftp_class):
+        files = {
             "/dir/file.grib2": b"0123456789abcdefghij",
             "/dir/file.grib2.idx": b"1:0:a:b:c:d:e\n2:10:a:b:c:d:e\n",
         }
-        self.sock = object()
-
-    def connect(self, host, port=None):
-        return None
-
-    def login(self, user, passwd):
-        return None
-
-    def set_pasv(self, flag):
-        return None
-
-    def quit(self):
-        return None
-
-    def abort(self):
-        return None
 
-    def cwd(self, d):
-        if not d.startswith("/"):
-            d = "/" + d
-        self.cwd_path = d
+    return GribFTP
 
-    def nlst(self, d=None):
-        return ["file.grib2", "file.grib2.idx"]
 
-    def size(self, filename):
-        path = self.cwd_path.rstrip("/") + "/" + filename
-        return len(self.files.get(path, b""))
-
-    def retrbinary(self, cmd, callback, blocksize=8192, rest=None):
-        _, fname = cmd.split()
-        path = self.cwd_path.rstrip("/") + "/" + fname
-        data = self.files[path]
-        start = int(rest) if rest is not None else 0
-        view = memoryview(data)[start:]
-        step = min(blocksize, len(view)) or 1
-        for i in range(0, len(view), step):
-            callback(view[i : i + step].tobytes())
-
-
-def test_ftp_get_size_and_ranges_and_idx():
-    with patch("zyra.connectors.backends.ftp.FTP", FakeFTP):
+def test_ftp_get_size_and_ranges_and_idx(grib_ftp):
+    with patch("zyra.connectors.backends.ftp.FTP", grib_ftp):
         url = "ftp://host/dir/file.grib2"
         assert ftp_backend.get_size(url) == 20
         lines = ftp_backend.get_idx_lines(url)
@@ -64,3 +29,65 @@ def test_ftp_get_size_and_ranges_and_idx():
         br = idx_to_byteranges(lines, r"b")
         data = ftp_backend.download_byteranges(url, br.keys(), max_workers=2)
         assert data == b"0123456789abcdefghij"
+
+
+def test_ftp_download_byteranges_reuses_sessions(grib_ftp):
+    class CountingFTP(grib_ftp):
+        logins = 0
+
+        def login(self, user, passwd):
+            type(self).logins += 1
+
+    ranges = [f"bytes={i}-{i + 1}" for i in range(0, 20, 2)]
+    with patch("zyra.connectors.backends.ftp.FTP", CountingFTP):
+        data = ftp_backend.download_byteranges(
+            "ftp://host/dir/file.grib2", ranges, max_workers=1
+        )
+    assert data == b"0123456789abcdefghij"
+    assert CountingFTP.logins == 1
+
+
+@pytest.mark.parametrize(
+    "reply,reused",
+    [
+        ("426 Connection closed; transfer aborted", True),
+        ("550 Requested action not taken", False),
+        (TimeoutError("timed out"), False),
+    ],
+)
+def test_ftp_download_byteranges_drops_sessions_that_cannot_resync(
+    grib_ftp, reply, reused
+):
+    import ftplib
+
+    class ResyncFTP(grib_ftp):
+        logins = 0
+
+        def login(self, user, passwd):
+            type(self).logins += 1
+
+        def voidresp(self):
+            if isinstance(reply, Exception):
+                raise reply
+            exc = ftplib.error_temp if reply[0] == "4" else ftplib.error_perm
+            raise exc(reply)
+
+    ranges = ["bytes=0-1", "bytes=10-11", "bytes=4-5"]
+    with patch("zyra.connectors.backends.ftp.FTP", ResyncFTP):
+        data = ftp_backend.download_byteranges(
+            "ftp://host/dir/file.grib2", ranges, max_workers=1, max_gap=None
+        )
+    assert data == b"01ab45"
+    assert ResyncFTP.logins == (1 if reused else len(ranges))
+
+
+def test_ftp_download_byteranges_small_blocks_and_short_read(grib_ftp):
+    class SmallBlockFTP(grib_ftp):
+        def retrbinary(self, cmd, callback, blocksize=8192, rest=None):
+            return super().retrbinary(cmd, callback, blocksize=3, rest=rest)
+
+    with patch("zyra.connectors.backends.ftp.FTP", SmallBlockFTP):
+        data = ftp_backend.download_byteranges(
+            "ftp://host/dir/file.grib2", ["bytes=2-6", "bytes=15-30"], max_gap=None
+        )
+    assert data == b"23456" + b"fghij"
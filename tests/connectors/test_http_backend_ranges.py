@@ -22,20 +22,25 @@ def test_http_get_size_and_idx_and_ranges():
     import sys
     import types
 
-    # first call returns idx, second/third return ranged bytes
     idx_resp = Mock()
     idx_resp.raise_for_status = lambda: None
     idx_resp.content = b"1:0:date:VAR:a:b:\n2:10:date:VAR:a:b:\n"
 
-    r1 = Mock()
-    r1.raise_for_status = lambda: None
-    r1.content = b"ABCDEFGHIJ"  # 10 bytes
-    r2 = Mock()
-    r2.raise_for_status = lambda: None
-    r2.content = b"KLMNOPQRST"  # next 10 bytes
+    payload = b"ABCDEFGHIJKLMNOPQRST"
 
-    # fake requests.get yields idx then range responses
-    fake_requests = types.SimpleNamespace(get=Mock(side_effect=[idx_resp, r1, r2]))
+    def _get(*a, headers=None, **k):
+        # No Range header means the .idx fetch; otherwise serve the requested
+        # slice of the payload (adjacent records coalesce into one request)
+        if not headers or "Range" not in headers:
+            return idx_resp
+        start, _, end = headers["Range"].replace("bytes=", "").partition("-")
+        r = Mock()
+        r.raise_for_status = lambda: None
+        r.content = payload[int(start) : (int(end) + 1 if end else None)]
+        return r
+
+    fake_get = Mock(side_effect=_get)
+    fake_requests = types.SimpleNamespace(get=fake_get)
     with patch.dict(sys.modules, {"requests": fake_requests}):
         lines = http_backend.get_idx_lines(url)
         assert lines
@@ -44,21 +49,84 @@ def test_http_get_size_and_idx_and_ranges():
         from zyra.utils.grib import idx_to_byteranges
 
         br = idx_to_byteranges(lines, r"VAR")
-        with patch.dict(sys.modules, {"requests": fake_requests}):
-            data = http_backend.download_byteranges(url, br.keys(), max_workers=2)
+        data = http_backend.download_byteranges(url, br.keys(), max_workers=2)
+        assert data == b"ABCDEFGHIJKLMNOPQRST"
+        # Adjacent ranges are fetched with one request
+        assert fake_get.call_count == 2
+        data = http_backend.download_byteranges(
+            url, br.keys(), max_workers=2, max_gap=None
+        )
         assert data == b"ABCDEFGHIJKLMNOPQRST"
+        assert fake_get.call_count == 4
 
 
-def test_http_list_files_scrape():
+def test_http_list_files_scrape(fake_requests_module):
     page = "https://example.com/list/"
     html = '<a href="file1.bin">file1.bin</a> <a href="sub/">sub/</a>'
-    import sys
-    import types
+    resp = Mock()
+    resp.raise_for_status = lambda: None
+    resp.text = html
+    fake_requests_module(get=lambda *a, **k: resp)
+    files = http_backend.list_files(page)
+    assert any("file1.bin" in f for f in files)
+
 
+def test_http_list_files_skips_query_and_fragment_links(fake_requests_module):
+    page = "https://example.com/list/"
+    html = (
+        '<a href="?C=N;O=D">Name</a> <a href="#top">top</a>'
+        "<A HREF = 'a.grib2'>a</A> <a href=\"b.txt\">b</a>"
+    )
     resp = Mock()
     resp.raise_for_status = lambda: None
     resp.text = html
-    fake_requests = types.SimpleNamespace(get=lambda *a, **k: resp)
-    with patch.dict(sys.modules, {"requests": fake_requests}):
-        files = http_backend.list_files(page)
-        assert any("file1.bin" in f for f in files)
+    fake_requests_module(get=lambda *a, **k: resp)
+    assert http_backend.list_files(page) == [
+        "https://example.com/list/a.grib2",
+        "https://example.com/list/b.txt",
+    ]
+    assert http_backend.list_files(page, pattern=r"\.grib2$") == [
+        "https://example.com/list/a.grib2"
+    ]
+
+
+def test_http_ranged_session_is_scoped_to_one_call(monkeypatch):
+    import types
+
+    import pytest
+
+    requests = pytest.importorskip("requests")
+    created = []
+
+    class _Session:
+        def __init__(self):
+            self.gets = 0
+            self.closed = False
+            created.append(self)
+
+        def mount(self, prefix, adapter):
+            pass
+
+        def get(self, url, headers=None, timeout=None):
+            self.gets += 1
+            r = Mock()
+            r.raise_for_status = lambda: None
+            r.content = b"xy"
+            return r
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(requests, "Session", _Session)
+    ranges = ["bytes=0-1", "bytes=100-101"]
+    for _ in range(2):
+        data = http_backend.download_byteranges(
+            "https://example.com/f", ranges, max_workers=2, max_gap=None
+        )
+        assert data == b"xyxy"
+    # A fresh session per call, used for all of that call's ranges, then closed
+    assert [(s.gets, s.closed) for s in created] == [(2, True), (2, True)]
+    # Stand-ins without Session are used directly
+    fake = types.SimpleNamespace(get=lambda *a, **k: None)
+    with http_backend._ranged_session(fake) as session:
+        assert session is fake
@@ -212,6 +212,7 @@ def test_fetch_bytes_does_not_retry_a_404(monkeypatch):
 
 
 def test_ranged_gets_retry_a_throttle(monkeypatch):
+    requests = pytest.importorskip("requests")
     # The path that actually failed in production: concurrent ranged GETs
     # for one file, throttled mid-batch.
     calls = {"n": 0}
@@ -223,6 +224,8 @@ def test_ranged_gets_retry_a_throttle(monkeypatch):
         return _OK()
 
     http_backend = _patch_requests_get(monkeypatch, fake_get)
+    # Ranged GETs go through the backend's pooled Session
+    monkeypatch.setattr(requests.Session, "get", lambda self, url, **kw: fake_get(url))
     out = http_backend.download_byteranges(
         "https://example.org/x.grib2", ["bytes=0-9"], max_workers=1
     )
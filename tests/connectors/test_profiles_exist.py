@@ -1,15 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import json
-from importlib import resources as importlib_resources
-
-
-def _load_profile(name: str) -> dict:
-    pkg = "zyra.assets.profiles"
-    path = importlib_resources.files(pkg).joinpath(f"{name}.json")
-    with importlib_resources.as_file(path) as p:
-        return json.loads(p.read_text(encoding="utf-8"))
+from zyra.connectors.discovery.utils import load_bundled_profile as _load_profile
 
 
 def test_bundled_sos_profile_parses_and_points_to_pkg():
@@ -10,11 +10,16 @@ def test_s3_unsigned_client_and_ranges():
         m_client.return_value = client
         client.head_object.return_value = {"ContentLength": 20}
 
-        client.get_object.side_effect = [
-            {"Body": Mock(read=lambda: b"1:0:a:b:c:d:e\n2:10:a:b:c:d:e\n")},
-            {"Body": Mock(read=lambda: b"0123456789")},
-            {"Body": Mock(read=lambda: b"abcdefghij")},
-        ]
+        payload = b"0123456789abcdefghij"
+
+        def _get_object(Bucket, Key, Range=None):
+            if Range is None:
+                return {"Body": Mock(read=lambda: b"1:0:a:b:c:d:e\n2:10:a:b:c:d:e\n")}
+            start, _, end = Range.replace("bytes=", "").partition("-")
+            part = payload[int(start) : (int(end) + 1 if end else None)]
+            return {"Body": Mock(read=lambda: part)}
+
+        client.get_object.side_effect = _get_object
 
         assert s3_backend.get_size("s3://bucket/key") == 20
 
@@ -27,3 +32,25 @@ def test_s3_unsigned_client_and_ranges():
             "s3://bucket/key", None, br.keys(), unsigned=True, max_workers=2
         )
         assert data == b"0123456789abcdefghij"
+        # idx fetch plus a single coalesced GetObject for both records
+        assert client.get_object.call_count == 2
+
+
+def test_s3_ranges_share_one_pooled_client():
+    with patch("zyra.connectors.backends.s3.boto3.client") as m_client:
+        client = Mock()
+        m_client.return_value = client
+        client.get_object.side_effect = lambda **kw: {
+            "Body": Mock(read=lambda: kw["Range"].encode())
+        }
+        data = s3_backend.download_byteranges(
+            "bucket",
+            "key",
+            ["bytes=0-1", "bytes=100-101"],
+            max_workers=16,
+            max_gap=None,
+        )
+        assert data == b"bytes=0-1bytes=100-101"
+        assert m_client.call_count == 1
+        cfg = m_client.call_args.kwargs["config"]
+        assert cfg.max_pool_connections == 32
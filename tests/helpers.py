@@ -16,3 +16,12 @@ def project_root(start: Path | None = None) -> Path:
             return anc
     # Fallback: the highest parent available, or `here` if none
     return here.parents[-1] if here.parents else here
+
+
+# Classic NetCDF ("CDF\x01"/"CDF\x02") and NetCDF4/HDF5 signatures
+_NETCDF_MAGICS = (b"CDF", b"\x89HDF")
+
+
+def is_netcdf(data: bytes) -> bool:
+    """Return True if ``data`` starts with a NetCDF classic or HDF5 signature."""
+    return data.startswith(_NETCDF_MAGICS)
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Long-lived ``zyra.cli`` worker for the CLI tests.
+
+Reads requests on stdin, each a JSON header line followed by the raw
+stdin payload::
+
+    {"argv": [...], "env": {...}, "cwd": "...", "stdin_len": N}\n<N bytes>
+
+runs :func:`zyra.cli.main` with those streams, environment and working
+directory, and writes a JSON header line followed by the raw stdout and
+stderr bytes::
+
+    {"rc": 0, "stdout_len": N, "stderr_len": M}\n<N bytes><M bytes>
+
+Payloads travel as raw bytes rather than base64-in-JSON, so large GRIB/NetCDF
+inputs are neither inflated nor re-encoded on either side.
+
+The protocol uses a private duplicate of fd 1. During a request fds 1 and 2
+are redirected to temporary files, so output from child processes a command
+spawns (e.g. wgrib2, ffmpeg) is captured and appended after the command's
+own stdout/stderr; between requests fd 1 points at stderr so nothing can
+corrupt the protocol stream.
+
+What differs from a fresh ``python -m zyra.cli`` process: argv, env, cwd,
+the standard streams and root logging handlers are reset around each call,
+but any other module-level state persists across requests — lru_caches,
+registries, loggers configured below the root, threads or pools a command
+leaves running, and signal handlers. Only stateless, stream-oriented
+commands (``process decode-grib2``/``convert-format``/``extract-variable``,
+``decimate local``) should go through the worker. Commands such as ``run``
+(pipeline runner: exports env flags and may start process pools),
+``wizard`` (session history and config), ``api``/server entry points, or
+anything that calls ``os.chdir`` or ``logging.basicConfig`` itself need a
+real subprocess.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import traceback
+
+
+def _serve() -> None:
+    requests_in = sys.stdin.buffer
+    replies_out = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+
+    from zyra.cli import main
+
+    root = logging.getLogger()
+    for line in requests_in:
+        req = json.loads(line)
+        payload = requests_in.read(int(req.get("stdin_len") or 0))
+        out, err = io.BytesIO(), io.BytesIO()
+        out_w = io.TextIOWrapper(out, write_through=True)
+        err_w = io.TextIOWrapper(err, write_through=True)
+        handlers = list(root.handlers)
+        saved_env = os.environ.copy()
+        saved_cwd = os.getcwd()
+        os.environ.clear()
+        os.environ.update(req.get("env") or saved_env)
+        if req.get("cwd"):
+            os.chdir(req["cwd"])
+        fd_out, fd_err = tempfile.TemporaryFile(), tempfile.TemporaryFile()
+        saved_fds = os.dup(1), os.dup(2)
+        os.dup2(fd_out.fileno(), 1)
+        os.dup2(fd_err.fileno(), 2)
+        sys.stdin = io.TextIOWrapper(io.BytesIO(payload))
+        sys.stdout, sys.stderr = out_w, err_w
+        try:
+            rc = main(list(req["argv"]))
+        except SystemExit as exc:
+            if isinstance(exc.code, int) or exc.code is None:
+                rc = exc.code or 0
+            else:
+                err_w.write(f"{exc.code}\n")
+                rc = 1
+        except Exception:
+            traceback.print_exc(file=err_w)
+            rc = 1
+        finally:
+            # Detach so collecting the wrappers does not close the buffers
+            out_w.detach()
+            err_w.detach()
+            sys.stdin, sys.stdout, sys.stderr = (
+                sys.__stdin__,
+                sys.__stdout__,
+                sys.__stderr__,
+            )
+            # Handlers bound to this request's stderr must not outlive it
+            root.handlers[:] = handlers
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+            for fd, saved in zip((1, 2), saved_fds):
+                os.dup2(saved, fd)
+                os.close(saved)
+        # Child-process output lands on the raw fds; append it to each stream
+        for buf, f in ((out, fd_out), (err, fd_err)):
+            with f:
+                f.seek(0)
+                buf.write(f.read())
+        stdout_view, stderr_view = out.getbuffer(), err.getbuffer()
+        header = {
+            "rc": int(rc or 0),
+            "stdout_len": len(stdout_view),
+            "stderr_len": len(stderr_view),
+        }
+        replies_out.write(json.dumps(header).encode("utf-8") + b"\n")
+        replies_out.write(stdout_view)
+        replies_out.write(stderr_view)
+        replies_out.flush()
+        stdout_view.release()
+        stderr_view.release()
+
+
+if __name__ == "__main__":
+    _serve()
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Shared fixtures for CLI and pipeline tests.
+
+Most CLI tests use the in-process ``run_cli`` fixture from
+``tests/conftest.py``. Tests that depend on real argv/exit semantics use
+``cli_worker`` instead: one separate ``zyra.cli`` process for the whole
+session (see ``_cli_worker.py``), so they stay isolated from the test
+process without paying interpreter startup per call. Module-level state
+persists across worker requests; ``_cli_worker.py`` lists which commands
+are safe to send there.
+
+The sample payloads are read once per session; ``bytes`` is immutable, so
+every test can share the same buffer.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+TESTDATA = Path("tests/testdata")
+
+
+@pytest.fixture(scope="session")
+def demo_nc_bytes() -> bytes:
+    return (TESTDATA / "demo.nc").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def demo_grib2_bytes() -> bytes:
+    path = TESTDATA / "demo.grib2"
+    if not path.exists():
+        pytest.skip("demo.grib2 not found")
+    return path.read_bytes()
+
+
+class _StdinFake:
+    """Minimal ``sys.stdin`` stand-in exposing only ``.buffer``."""
+
+    def __init__(self, data: bytes) -> None:
+        self.buffer = io.BytesIO(data)
+
+
+@pytest.fixture
+def fake_stdin(monkeypatch):
+    """Return a setter that points ``sys.stdin.buffer`` at the given bytes."""
+
+    def _set(data: bytes) -> _StdinFake:
+        fake = _StdinFake(data)
+        monkeypatch.setattr(sys, "stdin", fake)
+        return fake
+
+    return _set
+
+
+# Stand-in GRIB2 message body written by the fake wgrib2 for ``-grib`` output
+FAKE_GRIB2_BYTES = b"GRIB\x00\x00\x00\x02fake7777"
+
+
+@pytest.fixture
+def fake_wgrib2(monkeypatch, demo_nc_bytes):
+    """Pretend wgrib2 is installed and make ``subprocess.run`` emulate it.
+
+    ``-netcdf`` outputs receive ``demo.nc``; ``-grib`` outputs receive
+    ``grib_payload``. Each call's argv is appended to ``calls``.
+    """
+    calls: list[list[str]] = []
+
+    def fake_run(args, capture_output=False, text=False, check=False):  # noqa: ARG001
+        calls.append(list(args))
+        # The output path follows the -netcdf/-grib flag as the last arg
+        payload = demo_nc_bytes if args[-2] == "-netcdf" else FAKE_GRIB2_BYTES
+        Path(args[-1]).write_bytes(payload)
+        return types.SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(
+        "shutil.which", lambda name: "/usr/bin/wgrib2" if name == "wgrib2" else None
+    )
+    monkeypatch.setattr("subprocess.run", fake_run)
+    return types.SimpleNamespace(calls=calls, grib_payload=FAKE_GRIB2_BYTES)
+
+
+@pytest.fixture
+def make_pipeline_cfg(tmp_path):
+    """Write a pipeline config with the given stages; return its path."""
+    counter = itertools.count(1)
+
+    def _make(stages: list[dict], name: str = "pipeline") -> Path:
+        path = tmp_path / f"pipe{next(counter)}.json"
+        path.write_text(json.dumps({"name": name, "stages": stages}), encoding="utf-8")
+        return path
+
+    return _make
+
+
+class _CLIWorker:
+    """Client for the session-wide ``_cli_worker.py`` process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        try:
+            self._proc = subprocess.Popen(
+                [sys.executable, str(Path(__file__).with_name("_cli_worker.py"))],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._proc = None
+
+    def __call__(self, args, input_bytes: bytes | None = None):
+        argv = [str(a) for a in args]
+        with self._lock:
+            reply = self._request(argv, input_bytes)
+        if reply is None:
+            # Worker unavailable or died: fall back to a one-off process
+            return subprocess.run(
+                [sys.executable, "-m", "zyra.cli", *argv],
+                input=input_bytes,
+                capture_output=True,
+            )
+        rc, out, err = reply
+        return subprocess.CompletedProcess(argv, rc, out, err)
+
+    def _request(self, argv, input_bytes):
+        proc = self._proc
+        if proc is None or proc.poll() is not None:
+            return None
+        payload = memoryview(input_bytes or b"")
+        header = {
+            "argv": argv,
+            "env": dict(os.environ),
+            "cwd": os.getcwd(),
+            "stdin_len": len(payload),
+        }
+        try:
+            proc.stdin.write(json.dumps(header).encode("utf-8") + b"\n")
+            proc.stdin.write(payload)
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+            if not line:
+                return None
+            reply = json.loads(line)
+            out = proc.stdout.read(reply["stdout_len"])
+            err = proc.stdout.read(reply["stderr_len"])
+        except (OSError, ValueError, KeyError):
+            return None
+        return reply["rc"], out, err
+
+    def close(self) -> None:
+        if self._proc is not None:
+            with contextlib.suppress(OSError):
+                self._proc.stdin.close()
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+
+@pytest.fixture(scope="session")
+def cli_worker():
+    worker = _CLIWorker()
+    yield worker
+    worker.close()
@@ -1,5 +1,4 @@
 # SPDX-License-Identifier: Apache-2.0
-import io
 import subprocess
 import sys
 from pathlib import Path
@@ -7,46 +6,43 @@ from typing import Optional
 
 import pytest
 
+from tests.helpers import is_netcdf
+
 
 def _run_cli(args, input_bytes: Optional[bytes] = None) -> subprocess.CompletedProcess:
     cmd = [sys.executable, "-m", "zyra.cli", *args]
     return subprocess.run(cmd, input=input_bytes, capture_output=True)
 
 
-def _read_demo_nc_bytes() -> bytes:
-    p = Path("tests/testdata/demo.nc")
-    return p.read_bytes()
-
-
 @pytest.mark.cli
-def test_process_decode_grib2_raw_passthrough_group(monkeypatch, capsysbinary):
+def test_process_decode_grib2_raw_passthrough_group(
+    capsysbinary, demo_nc_bytes, fake_stdin
+):
     # process decode-grib2 should accept NetCDF on stdin and passthrough with --raw
     from zyra.cli import main
 
-    demo = _read_demo_nc_bytes()
-    fake_stdin = type("S", (), {"buffer": io.BytesIO(demo)})()
-    monkeypatch.setattr(sys, "stdin", fake_stdin)
+    fake_stdin(demo_nc_bytes)
 
     rc = main(["process", "decode-grib2", "-", "--raw"])
     assert rc == 0
     captured = capsysbinary.readouterr()
-    assert captured.out == demo
+    assert captured.out == demo_nc_bytes
     assert captured.err == b""
 
 
 @pytest.mark.cli
-def test_process_convert_format_autodetect_netcdf_group(monkeypatch, capsysbinary):
+def test_process_convert_format_autodetect_netcdf_group(
+    capsysbinary, demo_nc_bytes, fake_stdin
+):
     # process convert-format should read NetCDF on stdin and emit NetCDF bytes
     from zyra.cli import main
 
-    demo = _read_demo_nc_bytes()
-    fake_stdin = type("S", (), {"buffer": io.BytesIO(demo)})()
-    monkeypatch.setattr(sys, "stdin", fake_stdin)
+    fake_stdin(demo_nc_bytes)
 
     rc = main(["process", "convert-format", "-", "netcdf", "--stdout"])
     assert rc == 0
     captured = capsysbinary.readouterr()
-    assert captured.out.startswith(b"CDF") or captured.out.startswith(b"\x89HDF")
+    assert is_netcdf(captured.out)
 
 
 @pytest.mark.cli
@@ -58,7 +54,7 @@ def test_visualize_heatmap_npy_group(tmp_path: Path):
     except Exception:
         pytest.skip("visualization dependencies not available")
 
-    arr = (np.random.rand(32, 64) * 255).astype("float32")
+    arr = np.linspace(0, 255, 32 * 64, dtype="float32").reshape(32, 64)
     npy = tmp_path / "demo.npy"
     out = tmp_path / "out.png"
     np.save(npy, arr)
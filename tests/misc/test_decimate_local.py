@@ -1,26 +1,17 @@
 # SPDX-License-Identifier: Apache-2.0
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
+# Share one session cli_worker process when run under pytest-xdist
+pytestmark = pytest.mark.xdist_group("cli_worker")
+
 
 @pytest.mark.cli
-def test_decimate_local_creates_parent_dirs_and_writes(tmp_path: Path):
+def test_decimate_local_creates_parent_dirs_and_writes(tmp_path: Path, cli_worker):
     data = b"hello-world"
     nested = tmp_path / "a" / "b" / "c" / "out.bin"
-    cmd = [
-        sys.executable,
-        "-m",
-        "zyra.cli",
-        "decimate",
-        "local",
-        "-i",
-        "-",
-        str(nested),
-    ]
-    res = subprocess.run(cmd, input=data, capture_output=True)
+    res = cli_worker(["decimate", "local", "-i", "-", str(nested)], input_bytes=data)
     assert res.returncode == 0, res.stderr.decode(errors="ignore")
     assert nested.exists()
     assert nested.read_bytes() == data
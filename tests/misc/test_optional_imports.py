@@ -1,10 +1,18 @@
 # SPDX-License-Identifier: Apache-2.0
-from zyra import connectors, processing, utils, visualization
+import importlib
 
+import pytest
 
-def test_import_processing_package_without_viz():
+
+@pytest.mark.parametrize(
+    "module,attr",
+    [
+        ("zyra.connectors", "S3Connector"),
+        ("zyra.processing", "VideoProcessor"),
+        ("zyra.visualization", "PlotManager"),
+        ("zyra.utils", "DateManager"),
+    ],
+)
+def test_import_processing_package_without_viz(module, attr):
     # smoke-import modules, ensures packaging and optional deps don't break import
-    assert hasattr(connectors, "S3Connector")
-    assert hasattr(processing, "VideoProcessor")
-    assert hasattr(visualization, "PlotManager")
-    assert hasattr(utils, "DateManager")
+    assert hasattr(importlib.import_module(module), attr)
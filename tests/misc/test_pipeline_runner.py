@@ -4,13 +4,7 @@ from pathlib import Path
 
 import pytest
 
-
-def _run_cli(args, input_bytes: bytes | None = None):
-    import subprocess
-    import sys as _sys
-
-    cmd = [_sys.executable, "-m", "zyra.cli", *args]
-    return subprocess.run(cmd, input=input_bytes, capture_output=True)
+from tests.helpers import is_netcdf
 
 
 def test_build_argv_expands_list_values():
@@ -51,36 +45,34 @@ def test_build_argv_omits_empty_list_values():
 
 
 @pytest.mark.pipeline
-def test_run_process_convert_format_passthrough(tmp_path: Path):
+def test_run_process_convert_format_passthrough(
+    tmp_path: Path, run_cli, demo_nc_bytes, make_pipeline_cfg
+):
     # Pipeline: processing convert-format - netcdf --stdout; stdin is demo.nc
-    cfg = {
-        "name": "NC passthrough",
-        "stages": [
+    p = make_pipeline_cfg(
+        [
             {
                 "stage": "processing",
                 "command": "convert-format",
                 "args": {"file_or_url": "-", "format": "netcdf", "stdout": True},
             }
         ],
-    }
-    import json
-
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
+        name="NC passthrough",
+    )
 
-    demo = Path("tests/testdata/demo.nc").read_bytes()
-    res = _run_cli(["run", str(p)], input_bytes=demo)
+    res = run_cli(["run", str(p)], input_bytes=demo_nc_bytes)
     assert res.returncode == 0, res.stderr.decode(errors="ignore")
     out = res.stdout
-    assert out.startswith(b"CDF") or out.startswith(b"\x89HDF")
+    assert is_netcdf(out)
 
 
 @pytest.mark.pipeline
-def test_run_dry_run_builds_acquire_and_decimate_args(tmp_path: Path):
+def test_run_dry_run_builds_acquire_and_decimate_args(
+    tmp_path: Path, run_cli, make_pipeline_cfg
+):
     # Use backend-style for acquire (per wiki), and local decimation
-    cfg = {
-        "name": "Acquire + Decimate Dry Run",
-        "stages": [
+    p = make_pipeline_cfg(
+        [
             {
                 "stage": "acquisition",
                 "command": "acquire",
@@ -101,13 +93,10 @@ def test_run_dry_run_builds_acquire_and_decimate_args(tmp_path: Path):
                 },
             },
         ],
-    }
-    import json
-
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
+        name="Acquire + Decimate Dry Run",
+    )
 
-    res = _run_cli(["run", str(p), "--dry-run"])
+    res = run_cli(["run", str(p), "--dry-run"])
     assert res.returncode == 0, res.stderr.decode(errors="ignore")
     text = res.stdout.decode("utf-8")
     assert (
@@ -119,10 +108,11 @@ def test_run_dry_run_builds_acquire_and_decimate_args(tmp_path: Path):
 
 
 @pytest.mark.pipeline
-def test_dry_run_json_emits_objects_with_stage_and_name(tmp_path: Path):
-    cfg = {
-        "name": "JSON ARGV shape",
-        "stages": [
+def test_dry_run_json_emits_objects_with_stage_and_name(
+    tmp_path: Path, run_cli, make_pipeline_cfg
+):
+    p = make_pipeline_cfg(
+        [
             {
                 "id": "fetch-http-1",
                 "stage": "acquisition",
@@ -136,13 +126,10 @@ def test_dry_run_json_emits_objects_with_stage_and_name(tmp_path: Path):
                 "args": {"file_or_url": "-", "format": "netcdf"},
             },
         ],
-    }
-    import json
-
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
+        name="JSON ARGV shape",
+    )
 
-    res = _run_cli(["run", str(p), "--dry-run", "--print-argv-format=json"])
+    res = run_cli(["run", str(p), "--dry-run", "--print-argv-format=json"])
     assert res.returncode == 0
     items = json.loads(res.stdout.decode("utf-8"))
     assert isinstance(items, list) and len(items) == 2
@@ -158,107 +145,76 @@ def test_dry_run_json_emits_objects_with_stage_and_name(tmp_path: Path):
     )
 
 
-@pytest.mark.pipeline
-def test_dry_run_json_with_only_preserves_ids_and_reindexes(tmp_path: Path):
-    cfg = {
-        "name": "JSON only",
-        "stages": [
-            {
-                "id": "fetch1",
-                "stage": "acquisition",
-                "command": "acquire",
-                "args": {"backend": "http", "url": "https://example.com/a.nc"},
-            },
-            {
-                "id": "proc1",
-                "stage": "processing",
-                "command": "convert-format",
-                "args": {"file_or_url": "-", "format": "netcdf"},
-            },
-            {
-                "id": "proc2",
-                "stage": "processing",
-                "command": "convert-format",
-                "args": {"file_or_url": "-", "format": "netcdf"},
-            },
-        ],
-    }
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
-    res = _run_cli(
-        ["run", str(p), "--dry-run", "--print-argv-format=json", "--only", "process"]
-    )
-    assert res.returncode == 0
-    items = json.loads(res.stdout.decode("utf-8"))
-    # Only process stages remain, reindexed starting at 1, ids preserved
-    assert len(items) == 2
-    assert (
-        items[0]["stage"] == 1
-        and items[0]["name"] == "process"
-        and items[0]["id"] == "proc1"
-    )
-    assert (
-        items[1]["stage"] == 2
-        and items[1]["name"] == "process"
-        and items[1]["id"] == "proc2"
+@pytest.fixture(scope="module")
+def subset_cfg(tmp_path_factory) -> Path:
+    """One config shared by the --only and --start/--end dry-run cases."""
+    stages = [
+        {
+            "id": "s1",
+            "stage": "acquisition",
+            "command": "acquire",
+            "args": {"backend": "http", "url": "https://example.com/a.nc"},
+        },
+        {
+            "id": "s2",
+            "stage": "processing",
+            "command": "convert-format",
+            "args": {"file_or_url": "-", "format": "netcdf"},
+        },
+        {
+            "id": "s3",
+            "stage": "decimation",
+            "command": "local",
+            "args": {"input": "-", "path": "out.nc"},
+        },
+        {
+            "id": "s4",
+            "stage": "processing",
+            "command": "convert-format",
+            "args": {"file_or_url": "-", "format": "netcdf"},
+        },
+    ]
+    path = tmp_path_factory.mktemp("subset") / "pipe.json"
+    path.write_text(
+        json.dumps({"name": "JSON subset", "stages": stages}), encoding="utf-8"
     )
+    return path
 
 
 @pytest.mark.pipeline
-def test_dry_run_json_start_end_preserves_ids_and_reindexes(tmp_path: Path):
-    cfg = {
-        "name": "JSON start-end",
-        "stages": [
-            {
-                "id": "s1",
-                "stage": "acquisition",
-                "command": "acquire",
-                "args": {"backend": "http", "url": "https://example.com/a.nc"},
-            },
-            {
-                "id": "s2",
-                "stage": "processing",
-                "command": "convert-format",
-                "args": {"file_or_url": "-", "format": "netcdf"},
-            },
-            {
-                "id": "s3",
-                "stage": "decimation",
-                "command": "local",
-                "args": {"input": "-", "path": "out.nc"},
-            },
-        ],
-    }
-    p = tmp_path / "pipe2.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
-    res = _run_cli(
-        [
-            "run",
-            str(p),
-            "--dry-run",
-            "--print-argv-format=json",
-            "--start",
-            "2",
-            "--end",
-            "3",
-        ]
+@pytest.mark.parametrize(
+    "cli_flags,expected",
+    [
+        # Only process stages remain
+        (["--only", "process"], [("s2", "process"), ("s4", "process")]),
+        # Original stages 2 and 3
+        (["--start", "2", "--end", "3"], [("s2", "process"), ("s3", "decimate")]),
+    ],
+    ids=["only", "start-end"],
+)
+def test_dry_run_json_subset_preserves_ids_and_reindexes(
+    subset_cfg: Path, run_cli, cli_flags, expected
+):
+    res = run_cli(
+        ["run", str(subset_cfg), "--dry-run", "--print-argv-format=json", *cli_flags]
     )
     assert res.returncode == 0
     items = json.loads(res.stdout.decode("utf-8"))
-    assert len(items) == 2
-    # Reindexed stages start at 1; ids correspond to original stages 2 and 3
-    assert items[0]["stage"] == 1 and items[0]["id"] == "s2"
-    assert items[1]["stage"] == 2 and items[1]["id"] == "s3"
+    # Reindexed stages start at 1; ids and names follow the original stages
+    assert [(it["stage"], it["id"], it["name"]) for it in items] == [
+        (i, sid, name) for i, (sid, name) in enumerate(expected, start=1)
+    ]
     # argv arrays present and start with 'zyra'
-    assert isinstance(items[0]["argv"], list) and items[0]["argv"][0] == "zyra"
+    assert all(isinstance(it["argv"], list) and it["argv"][0] == "zyra" for it in items)
 
 
 @pytest.mark.pipeline
-def test_run_process_then_decimate_local(tmp_path: Path):
+def test_run_process_then_decimate_local(
+    tmp_path: Path, run_cli, demo_nc_bytes, make_pipeline_cfg
+):
     # Convert NetCDF stdin (pass-through) then write to a file via decimate local
-    cfg = {
-        "name": "NC to file",
-        "stages": [
+    p = make_pipeline_cfg(
+        [
             {
                 "stage": "processing",
                 "command": "convert-format",
@@ -270,27 +226,24 @@ def test_run_process_then_decimate_local(tmp_path: Path):
                 "args": {"input": "-", "path": str(tmp_path / "out.nc")},
             },
         ],
-    }
-    import json
-
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
+        name="NC to file",
+    )
 
-    demo = Path("tests/testdata/demo.nc").read_bytes()
-    res = _run_cli(["run", str(p)], input_bytes=demo)
+    res = run_cli(["run", str(p)], input_bytes=demo_nc_bytes)
     assert res.returncode == 0, res.stderr.decode(errors="ignore")
     out_file = tmp_path / "out.nc"
     assert out_file.exists()
     data = out_file.read_bytes()
-    assert data.startswith(b"CDF") or data.startswith(b"\x89HDF")
+    assert is_netcdf(data)
 
 
 @pytest.mark.pipeline
-def test_stage_name_overrides_apply_correctly(tmp_path: Path):
+def test_stage_name_overrides_apply_correctly(
+    tmp_path: Path, run_cli, demo_nc_bytes, make_pipeline_cfg
+):
     # Use stage-name overrides to change arguments on targeted stages
-    cfg = {
-        "name": "Stage-name overrides",
-        "stages": [
+    p = make_pipeline_cfg(
+        [
             {
                 "stage": "processing",
                 "command": "convert-format",
@@ -302,17 +255,13 @@ def test_stage_name_overrides_apply_correctly(tmp_path: Path):
                 "args": {"input": "-", "path": str(tmp_path / "ORIG.nc")},
             },
         ],
-    }
-    import json
-
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
+        name="Stage-name overrides",
+    )
 
-    demo = Path("tests/testdata/demo.nc").read_bytes()
     # Override the path on the decimation stage via stage-name syntax
-    res = _run_cli(
+    res = run_cli(
         ["run", str(p), "--set", f"decimation.path={tmp_path/'NEW.nc'}"],
-        input_bytes=demo,
+        input_bytes=demo_nc_bytes,
     )
     assert res.returncode == 0, res.stderr.decode(errors="ignore")
     assert (tmp_path / "NEW.nc").exists()
@@ -320,12 +269,13 @@ def test_stage_name_overrides_apply_correctly(tmp_path: Path):
 
 
 @pytest.mark.pipeline
-def test_run_start_end_subset(tmp_path: Path):
+def test_run_start_end_subset(
+    tmp_path: Path, run_cli, demo_nc_bytes, make_pipeline_cfg
+):
     # Stages: [1] process convert, [2] process convert, [3] decimate local
     # Run only stage 2 via --start/--end and assert stdout NetCDF header
-    cfg = {
-        "name": "subset",
-        "stages": [
+    p = make_pipeline_cfg(
+        [
             {
                 "stage": "processing",
                 "command": "convert-format",
@@ -342,24 +292,21 @@ def test_run_start_end_subset(tmp_path: Path):
                 "args": {"input": "-", "path": str(tmp_path / "out.nc")},
             },
         ],
-    }
-    import json
-
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
+        name="subset",
+    )
 
-    demo = Path("tests/testdata/demo.nc").read_bytes()
-    res = _run_cli(["run", str(p), "--start", "2", "--end", "2"], input_bytes=demo)
+    res = run_cli(
+        ["run", str(p), "--start", "2", "--end", "2"], input_bytes=demo_nc_bytes
+    )
     assert res.returncode == 0
-    assert res.stdout.startswith(b"CDF") or res.stdout.startswith(b"\x89HDF")
+    assert is_netcdf(res.stdout)
 
 
 @pytest.mark.pipeline
-def test_run_only_stage_name(tmp_path: Path):
+def test_run_only_stage_name(tmp_path: Path, run_cli, demo_nc_bytes, make_pipeline_cfg):
     # Only run process stage and emit stdout NetCDF
-    cfg = {
-        "name": "only-process",
-        "stages": [
+    p = make_pipeline_cfg(
+        [
             {
                 "stage": "processing",
                 "command": "convert-format",
@@ -371,13 +318,9 @@ def test_run_only_stage_name(tmp_path: Path):
                 "args": {"input": "-", "path": str(tmp_path / "out.nc")},
             },
         ],
-    }
-    import json
-
-    p = tmp_path / "pipe.json"
-    p.write_text(json.dumps(cfg), encoding="utf-8")
+        name="only-process",
+    )
 
-    demo = Path("tests/testdata/demo.nc").read_bytes()
-    res = _run_cli(["run", str(p), "--only", "process"], input_bytes=demo)
+    res = run_cli(["run", str(p), "--only", "process"], input_bytes=demo_nc_bytes)
     assert res.returncode == 0
-    assert res.stdout.startswith(b"CDF") or res.stdout.startswith(b"\x89HDF")
+    assert is_netcdf(res.stdout)
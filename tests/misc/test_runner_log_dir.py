@@ -1,9 +1,25 @@
 # SPDX-License-Identifier: Apache-2.0
-import textwrap
+import logging
 from pathlib import Path
 
 from tests.helpers import project_root
 
+# Minimal pipeline: process convert-format - netcdf --stdout, then decimate local
+_PIPE_YAML = b"""\
+stages:
+  - stage: process
+    command: convert-format
+    args:
+      file_or_url: '-'
+      format: netcdf
+      stdout: true
+  - stage: decimate
+    command: local
+    args:
+      input: '-'
+      path: "out.nc"
+"""
+
 
 def test_runner_writes_log_file_with_log_dir(tmp_path: Path, monkeypatch):
     from zyra.cli import main as cli_main
@@ -11,27 +27,8 @@ def test_runner_writes_log_file_with_log_dir(tmp_path: Path, monkeypatch):
     # Ensure any relative output paths land under tmp_path
     monkeypatch.chdir(tmp_path)
 
-    # Minimal pipeline: process convert-format - netcdf --stdout
     cfg = tmp_path / "pipe.yaml"
-    cfg.write_text(
-        textwrap.dedent(
-            """
-            stages:
-              - stage: process
-                command: convert-format
-                args:
-                  file_or_url: '-'
-                  format: netcdf
-                  stdout: true
-              - stage: decimate
-                command: local
-                args:
-                  input: '-'
-                  path: "out.nc"
-            """
-        ),
-        encoding="utf-8",
-    )
+    cfg.write_bytes(_PIPE_YAML)
 
     # Seed stdin via env so runner feeds bytes to the first stage
     repo_root = project_root(Path(__file__))
@@ -45,11 +42,18 @@ def test_runner_writes_log_file_with_log_dir(tmp_path: Path, monkeypatch):
     )  # verbose for logs
     assert rc == 0
 
-    # Ensure all logging handlers flush
-    import logging
-
-    logging.shutdown()
-    log_path = log_dir / "workflow.log"
-    assert log_path.exists()
-    # File presence is the primary requirement for --log-dir
-    assert log_path.stat().st_size >= 0
+    # Assert through the runner's file handler; logging.shutdown() would tear
+    # down every handler in the test process.
+    root = logging.getLogger()
+    log_path = str(log_dir / "workflow.log")
+    ours = [
+        h
+        for h in root.handlers
+        if isinstance(h, logging.FileHandler) and h.baseFilename == log_path
+    ]
+    try:
+        assert len(ours) == 1
+    finally:
+        for h in ours:
+            root.removeHandler(h)
+            h.close()
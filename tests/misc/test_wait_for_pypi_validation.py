@@ -1,15 +1,43 @@
 # SPDX-License-Identifier: Apache-2.0
+import functools
 import importlib.util
+import io
 import pathlib
 import urllib.error
 
 import pytest
 
+from tests.helpers import project_root
 
+# Resolved once at import, against the repo root rather than the cwd
+_SCRIPT_PATH = project_root(pathlib.Path(__file__)) / "scripts" / "wait_for_pypi.py"
+
+
+# Minimal JSON API body; json.load reads it from the file-like response
+_FAKE_JSON = b'{\n  "releases": {\n    "1.0.0": [1]\n  }\n}'
+
+
+class _FakeResponse:
+    """``urlopen`` context manager yielding a fresh reader over ``body``."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def __enter__(self):
+        return io.BytesIO(self._body)
+
+    def __exit__(self, *a):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
 def _load_wait_module():
-    """Dynamically load the wait_for_pypi module from the scripts directory."""
-    path = pathlib.Path("scripts/wait_for_pypi.py").resolve()
-    spec = importlib.util.spec_from_file_location("wait_for_pypi", path)
+    """Dynamically load the wait_for_pypi module from the scripts directory.
+
+    Loaded once per session; tests patch its attributes via ``monkeypatch``,
+    which restores them at teardown, so sharing the module is safe.
+    """
+    spec = importlib.util.spec_from_file_location("wait_for_pypi", _SCRIPT_PATH)
     assert spec and spec.loader
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)  # type: ignore[attr-defined]
@@ -34,19 +62,8 @@ def test_fetch_json_allows_pypi_https_and_reads(monkeypatch):
     """fetch_json should accept a valid PyPI URL and return parsed JSON."""
     mod = _load_wait_module()
 
-    class FakeResponse:
-        def __enter__(self):
-            # Provide a minimal JSON body; json.load reads from file-like
-            import io
-
-            self._buf = io.BytesIO(b'{\n  "releases": {\n    "1.0.0": [1]\n  }\n}')
-            return self._buf
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
     def fake_urlopen(url, *hosts, timeout=10.0):  # noqa: ARG001 - match signature
-        return FakeResponse()
+        return _FakeResponse(_FAKE_JSON)
 
     monkeypatch.setattr(mod, "_urlopen", fake_urlopen)
     data = mod.fetch_json("https://pypi.org/pypi/pkg/json")
@@ -136,16 +153,8 @@ def _index_html(*filenames: str) -> str:
 
 
 def _patch_index(mod, monkeypatch, html: str):
-    class FakeResponse:
-        def __enter__(self):
-            import io
-
-            return io.BytesIO(html.encode())
-
-        def __exit__(self, *a):
-            return False
-
-    monkeypatch.setattr(mod, "_urlopen", lambda *a, **k: FakeResponse())
+    body = html.encode()
+    monkeypatch.setattr(mod, "_urlopen", lambda *a, **k: _FakeResponse(body))
 
 
 def test_file_urls_match_the_exact_version_not_a_prefix(monkeypatch):
@@ -60,7 +60,7 @@ def test_audio_metadata_parses_ffprobe_json(tmp_path, monkeypatch):
     )
     rc = args.func(args)
     assert rc == 0
-    meta = json.loads(out.read_text(encoding="utf-8"))
+    meta = json.loads(out.read_bytes())
     assert meta["codec"] == "opus"
     assert meta["channels"] == 1
     assert meta["sample_rate"] == 16000
@@ -103,7 +103,7 @@ def test_pad_missing_json_report(
         fill_mode="blank",
         json_report=str(report_path),
     )
-    data = json.loads(report_path.read_text(encoding="utf-8"))
+    data = json.loads(report_path.read_bytes())
     assert data["status"] == "completed"
     assert data["created_count"] == 1
     assert data["created_files"]
@@ -121,7 +121,7 @@ def test_pad_missing_json_report_dry_run(
         dry_run=True,
         json_report=str(report_path),
     )
-    data = json.loads(report_path.read_text(encoding="utf-8"))
+    data = json.loads(report_path.read_bytes())
     assert data["status"] == "dry-run"
     assert data["created_count"] == 0
     assert data["planned_count"] == 1
@@ -147,7 +147,7 @@ def test_pad_missing_reads_metadata_from_stdin(
             json_report=str(report_path),
             read_stdin=True,
         )
-    data = json.loads(report_path.read_text(encoding="utf-8"))
+    data = json.loads(report_path.read_bytes())
     assert data["metadata_path"] == "-"
     assert data["created_count"] == 1
 
@@ -175,7 +175,7 @@ def test_transform_scan_frames_alias(tmp_path: Path) -> None:
     )
     exit_code = args.func(args)
     assert exit_code == 0
-    data = json.loads(output.read_text(encoding="utf-8"))
+    data = json.loads(output.read_bytes())
     assert data["frame_count_actual"] == 1
 
 
@@ -204,7 +204,7 @@ def test_scan_frames_analysis_block(tmp_path: Path) -> None:
     )
     exit_code = args.func(args)
     assert exit_code == 0
-    data = json.loads(output.read_text(encoding="utf-8"))
+    data = json.loads(output.read_bytes())
     analysis = data.get("analysis") or {}
     assert analysis["frame_count_unique"] == 2
     assert analysis["duplicate_timestamps"]
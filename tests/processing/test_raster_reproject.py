@@ -7,12 +7,16 @@ geographic location must land at the predicted pixel of the EPSG:4326
 full-globe grid.
 """
 
+import functools
+from pathlib import Path
+
 import numpy as np
 import pytest
 
 rasterio = pytest.importorskip("rasterio")
 
 from rasterio.crs import CRS  # noqa: E402
+from rasterio.io import MemoryFile  # noqa: E402
 from rasterio.transform import from_bounds  # noqa: E402
 from rasterio.warp import transform as crs_transform  # noqa: E402
 
@@ -28,8 +32,9 @@ PS_BOUNDS = (-4_000_000.0, -4_000_000.0, 4_000_000.0, 4_000_000.0)
 MARKER_LON, MARKER_LAT = 45.0, 80.0
 
 
-def _write_polar_stereo_marker(path: str, size: int = 400) -> None:
-    """Write an EPSG:3413 GeoTIFF with a bright marker at (45E, 80N)."""
+@functools.lru_cache(maxsize=None)
+def _polar_stereo_marker_bytes(size: int) -> bytes:
+    """Encode the marker GeoTIFF once per size; callers copy the bytes."""
     crs = CRS.from_epsg(3413)
     transform = from_bounds(*PS_BOUNDS, size, size)
     data = np.zeros((1, size, size), dtype=np.uint8)
@@ -38,18 +43,23 @@ def _write_polar_stereo_marker(path: str, size: int = 400) -> None:
     col, row = (~transform) * (x, y)
     row, col = int(row), int(col)
     data[0, row - 4 : row + 5, col - 4 : col + 5] = 255
-    with rasterio.open(
-        path,
-        "w",
-        driver="GTiff",
-        width=size,
-        height=size,
-        count=1,
-        dtype="uint8",
-        crs=crs,
-        transform=transform,
-    ) as dst:
-        dst.write(data)
+    with MemoryFile() as mem:
+        with mem.open(
+            driver="GTiff",
+            width=size,
+            height=size,
+            count=1,
+            dtype="uint8",
+            crs=crs,
+            transform=transform,
+        ) as dst:
+            dst.write(data)
+        return mem.read()
+
+
+def _write_polar_stereo_marker(path: str, size: int = 400) -> None:
+    """Write an EPSG:3413 GeoTIFF with a bright marker at (45E, 80N)."""
+    Path(path).write_bytes(_polar_stereo_marker_bytes(size))
 
 
 def test_round_trip_polar_stereo_marker(tmp_path):
@@ -85,7 +85,7 @@ def test_video_transcode_single_file(tmp_path, monkeypatch, _patch_ffmpeg):
     assert rc == 0
     assert out.exists()
     assert metadata_out.exists()
-    metadata = json.loads(metadata_out.read_text())
+    metadata = json.loads(metadata_out.read_bytes())
     assert metadata[0]["metadata"]["video_codec"] == "h264"
     ffmpeg_cmd = commands[0]
     assert "-c:v" in ffmpeg_cmd and ffmpeg_cmd[ffmpeg_cmd.index("-c:v") + 1] == "h264"
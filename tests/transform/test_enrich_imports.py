@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: Apache-2.0
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+def test_enrich_import_skips_http_and_s3_stacks():
+    code = (
+        "import json, sys\n"
+        "import zyra.transform.enrich\n"
+        "print(json.dumps([m for m in ('requests', 'boto3') if m in sys.modules]))\n"
+    )
+    res = subprocess.run(
+        [sys.executable, "-c", code], check=False, capture_output=True, text=True
+    )
+    assert res.returncode == 0, res.stderr
+    assert json.loads(res.stdout.strip()) == []
+
+
+def test_connectors_lazy_clients_are_listed_and_unknown_names_raise():
+    import zyra.connectors as connectors
+
+    assert {"FTPConnector", "S3Connector"} <= set(dir(connectors))
+    with pytest.raises(
+        AttributeError, match="module 'zyra.connectors' has no attribute 'Nope'"
+    ):
+        _ = connectors.Nope
@@ -1,21 +1,15 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import json
-
 from zyra.connectors.discovery import LocalCatalogBackend
+from zyra.connectors.discovery.utils import load_bundled_profile
 from zyra.transform.enrich import enrich_items
 
 
 def test_profile_defaults_applied_to_sos_items():
     items = LocalCatalogBackend().search("tsunami", limit=1)
     # Load bundled sos profile defaults
-    from importlib import resources as importlib_resources
-
-    pkg = "zyra.assets.profiles"
-    path = importlib_resources.files(pkg).joinpath("sos.json")
-    with importlib_resources.as_file(path) as p:
-        prof = json.loads(p.read_text(encoding="utf-8"))
+    prof = load_bundled_profile("sos")
     defaults = (prof.get("enrichment") or {}).get("defaults") or {}
     out = enrich_items(
         items,
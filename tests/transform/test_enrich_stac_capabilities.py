@@ -1,7 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import os
+import shutil
+
 from zyra.connectors.discovery import DatasetMetadata
+from zyra.transform import enrich as enrich_mod
 from zyra.transform.enrich import enrich_items
 
 
@@ -28,3 +32,19 @@ def test_stac_capabilities_collection_offline():
     )
     vars = out[0].enrichment.variables
     assert any(v.name in {"B1", "blue"} for v in vars)
+
+
+def test_stac_local_json_parsed_once_until_modified(tmp_path):
+    src = tmp_path / "stac.json"
+    shutil.copyfile("tests/testdata/stac_collection.json", src)
+    uri = f"file:{src}"
+    enrich_mod._parse_local_json.cache_clear()
+    for _ in range(2):
+        assert enrich_mod._load_json_uri(uri, offline=True)["id"]
+    info = enrich_mod._parse_local_json.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    # A rewrite changes the mtime key, so the new contents are parsed
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    enrich_mod._load_json_uri(uri, offline=True)
+    assert enrich_mod._parse_local_json.cache_info().misses == 2
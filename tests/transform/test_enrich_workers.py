@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import threading
+
+import zyra.transform.enrich as enrich_mod
+from zyra.connectors.discovery import DatasetMetadata
+from zyra.transform.enrich import enrich_items
+from zyra.transform.enrich.models import DatasetEnrichment
+
+
+class _ThreadRecorder:
+    name = "thread-recorder"
+
+    def __init__(self):
+        self.threads: list[int] = []
+
+    def supports(self, item):
+        return True
+
+    def enrich(self, item, level, ctx):
+        self.threads.append(threading.get_ident())
+        return DatasetEnrichment(format_detail=item.id)
+
+
+def _items(n):
+    return [
+        DatasetMetadata(
+            id=f"i{k}", name=f"n{k}", description=None, source="t", format="", uri=""
+        )
+        for k in range(n)
+    ]
+
+
+def test_enrich_items_runs_inline_with_one_worker(tmp_path, monkeypatch):
+    monkeypatch.setenv("ZYRA_CACHE_DIR", str(tmp_path))
+    rec = _ThreadRecorder()
+    monkeypatch.setitem(enrich_mod._REGISTRY, "test-workers", [rec])
+    out = enrich_items(_items(3), level="test-workers", workers=1)
+    assert rec.threads == [threading.get_ident()] * 3
+    assert [o.enrichment.format_detail for o in out] == ["i0", "i1", "i2"]
+
+
+def test_enrich_items_keeps_input_order_with_workers(tmp_path, monkeypatch):
+    monkeypatch.setenv("ZYRA_CACHE_DIR", str(tmp_path))
+    rec = _ThreadRecorder()
+    monkeypatch.setitem(enrich_mod._REGISTRY, "test-workers", [rec])
+    out = enrich_items(_items(8), level="test-workers", workers=4)
+    assert len(rec.threads) == 8
+    assert threading.get_ident() not in rec.threads
+    assert [o.enrichment.format_detail for o in out] == [f"i{k}" for k in range(8)]
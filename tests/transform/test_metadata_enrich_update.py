@@ -1,21 +1,27 @@
 # SPDX-License-Identifier: Apache-2.0
 import json
 
+import pytest
+
 from zyra.transform import _compute_frames_metadata as compute_meta
 from zyra.transform import register_cli as register_transform
 
 
-def test_compute_frames_metadata_weekly(tmp_path):
-    d = tmp_path / "frames"
-    d.mkdir()
+@pytest.fixture(scope="module")
+def weekly_frames_dir(tmp_path_factory):
+    """Weekly-named frame stubs with a gap; read-only, so shared per module."""
+    d = tmp_path_factory.mktemp("frames")
     # Create weekly-named files, leave a gap to test missing
     (d / "DroughtRisk_Weekly_20240101.png").write_bytes(b"a")
     (d / "DroughtRisk_Weekly_20240108.png").write_bytes(b"b")
     # missing 20240115
     (d / "DroughtRisk_Weekly_20240122.png").write_bytes(b"c")
+    return d
+
 
+def test_compute_frames_metadata_weekly(weekly_frames_dir):
     meta = compute_meta(
-        str(d),
+        str(weekly_frames_dir),
         pattern=r"DroughtRisk_Weekly_(\d{8})\.png",
         datetime_format="%Y%m%d",
         period_seconds=7 * 24 * 3600,
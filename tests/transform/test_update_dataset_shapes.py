@@ -1,9 +1,21 @@
 # SPDX-License-Identifier: Apache-2.0
+import argparse
+import functools
 import json
 
+import pytest
+
 from zyra.transform import register_cli as register_transform
 
 
+@functools.lru_cache(maxsize=1)
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    register_transform(sub)
+    return parser
+
+
 def _run_update(tmp_path, src_obj):
     ds = tmp_path / "ds.json"
     ds.write_text(json.dumps(src_obj))
@@ -14,12 +26,7 @@ def _run_update(tmp_path, src_obj):
     }
     mf = tmp_path / "m.json"
     mf.write_text(json.dumps(meta))
-    import argparse
-
-    parser = argparse.ArgumentParser()
-    sub = parser.add_subparsers(dest="cmd", required=True)
-    register_transform(sub)
-    ns = parser.parse_args(
+    ns = _parser().parse_args(
         [
             "update-dataset-json",
             "--input-file",
@@ -37,49 +44,29 @@ def _run_update(tmp_path, src_obj):
     return json.loads((tmp_path / "out.json").read_text())
 
 
-def test_update_top_level_array(tmp_path):
-    src = [
-        {"id": "OTHER"},
-        {
-            "id": "INTERNAL_SOS_DROUGHT_RT",
-            "startTime": None,
-            "endTime": None,
-            "dataLink": "",
-        },
-    ]
-    out = _run_update(tmp_path, src)
-    match = [e for e in out if e.get("id") == "INTERNAL_SOS_DROUGHT_RT"][0]
-    assert match["startTime"].startswith("2024-01-01")
-    assert match["endTime"].startswith("2024-01-22")
-    assert match["dataLink"].endswith("/900")
+_ENTRY = {
+    "id": "INTERNAL_SOS_DROUGHT_RT",
+    "startTime": None,
+    "endTime": None,
+    "dataLink": "",
+}
 
 
-def test_update_object_with_datasets_list(tmp_path):
-    src = {
-        "datasets": [
-            {
-                "id": "INTERNAL_SOS_DROUGHT_RT",
-                "startTime": None,
-                "endTime": None,
-                "dataLink": "",
-            }
-        ]
-    }
-    out = _run_update(tmp_path, src)
-    match = [e for e in out["datasets"] if e.get("id") == "INTERNAL_SOS_DROUGHT_RT"][0]
+def _by_id(entries):
+    return [e for e in entries if e.get("id") == "INTERNAL_SOS_DROUGHT_RT"][0]
+
+
+@pytest.mark.parametrize(
+    "src,select",
+    [
+        ([{"id": "OTHER"}, dict(_ENTRY)], _by_id),
+        ({"datasets": [dict(_ENTRY)]}, lambda out: _by_id(out["datasets"])),
+        (dict(_ENTRY), lambda out: out),
+    ],
+    ids=["top-level-array", "object-with-datasets-list", "single-object"],
+)
+def test_update_dataset_shapes(tmp_path, src, select):
+    match = select(_run_update(tmp_path, src))
     assert match["startTime"].startswith("2024-01-01")
     assert match["endTime"].startswith("2024-01-22")
     assert match["dataLink"].endswith("/900")
-
-
-def test_update_single_object(tmp_path):
-    src = {
-        "id": "INTERNAL_SOS_DROUGHT_RT",
-        "startTime": None,
-        "endTime": None,
-        "dataLink": "",
-    }
-    out = _run_update(tmp_path, src)
-    assert out["startTime"].startswith("2024-01-01")
-    assert out["endTime"].startswith("2024-01-22")
-    assert out["dataLink"].endswith("/900")
@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from zyra.utils.grib import (
+    coalesce_ranges,
+    coalesced_download_byteranges,
     compute_chunks,
     ensure_idx_path,
     idx_to_byteranges,
@@ -29,9 +31,63 @@ def test_parse_and_ranges():
     assert keys[1].startswith("bytes=250-")
 
 
+def test_parse_idx_lines_accepts_buffers_and_skips_blank_lines():
+    raw = b"1:0:d:TMP:surface:anl:\r\n\n2:100:d:UGRD:10 m above ground:f003:\n"
+    expected = ["1:0:d:TMP:surface:anl:", "2:100:d:UGRD:10 m above ground:f003:"]
+    assert parse_idx_lines(raw) == expected
+    assert parse_idx_lines(memoryview(bytearray(raw))) == expected
+    assert parse_idx_lines(raw.decode()) == expected
+
+
 def test_compute_chunks():
     ranges = compute_chunks(1024, chunk_size=256)
     # 1024 bytes / 256 -> 4 ranges
     assert len(ranges) == 4
     assert ranges[0] == "bytes=0-255"
     assert ranges[-1] == "bytes=768-1024"
+
+
+def test_coalesce_ranges_merges_nearby_and_keeps_large_chunks_apart():
+    assert coalesce_ranges([(10, 19), (0, 9), (25, None)], max_gap=5) == [(0, None)]
+    assert coalesce_ranges([(0, 9), (100, 109)], max_gap=5) == [(0, 9), (100, 109)]
+    chunks = [(0, 255), (256, 511)]
+    assert coalesce_ranges(chunks, max_span=300) == chunks
+
+
+def test_coalesced_download_slices_back_in_input_order():
+    payload = bytes(range(64))
+    calls = []
+
+    def fetch(_key, rng):
+        calls.append(rng)
+        start, _, end = rng.replace("bytes=", "").partition("-")
+        return payload[int(start) : (int(end) + 1 if end else None)]
+
+    ranges = ["bytes=40-", "bytes=0-3", "bytes=8-11", "bytes=2-5"]
+    out = coalesced_download_byteranges(fetch, "k", ranges, max_gap=4)
+    assert out == payload[40:] + payload[0:4] + payload[8:12] + payload[2:6]
+    assert sorted(calls) == ["bytes=0-11", "bytes=40-"]
+
+
+def test_coalesced_download_groups_sharing_a_start_offset():
+    # (0, 9) cannot merge into the 40-byte range past max_span, so two groups
+    # start at offset 0; each range must be sliced from the group it was
+    # merged into, not the last group at that offset.
+    data = bytes(range(64))
+
+    def fetch(_key, rng):
+        start, _, end = rng.replace("bytes=", "").partition("-")
+        return data[int(start) : int(end) + 1]
+
+    ranges = ["bytes=0-39", "bytes=5-9", "bytes=0-9"]
+    out = coalesced_download_byteranges(fetch, "k", ranges, max_span=16)
+    assert out == data[:40] + data[5:10] + data[:10]
+
+
+def test_idx_to_byteranges_accepts_compiled_pattern():
+    import re
+
+    lines = ["1:0:d:TMP:surface:anl:", "2:100:d:UGRD:10 m:anl:", "3:250:d:TMP:2 m:anl:"]
+    rx = re.compile(r":TMP:")
+    assert idx_to_byteranges(lines, rx) == idx_to_byteranges(lines, r":TMP:")
+    assert list(idx_to_byteranges(lines, rx)) == ["bytes=0-99", "bytes=250-"]
@@ -29,3 +29,11 @@ def test_get_date_range_for_months(date_manager):
     # Placeholder for future logic; ensures fixture wiring works
     start_date, end_date = date_manager.get_date_range("1M")
     assert isinstance(start_date, datetime) and isinstance(end_date, datetime)
+
+
+def test_extract_date_time_reuses_compiled_format_regex(date_manager):
+    """Test the filename regex for a format is compiled once per instance."""
+    assert date_manager.extract_date_time("a_20240102.png") == "2024-01-02T00:00:00"
+    rx = date_manager._format_regexes["%Y%m%d"]
+    assert date_manager.extract_date_time("b_20250304.png") == "2025-03-04T00:00:00"
+    assert date_manager._format_regexes["%Y%m%d"] is rx
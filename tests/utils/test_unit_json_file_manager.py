@@ -7,9 +7,9 @@ from zyra.utils.json_file_manager import JSONFileManager
 
 
 @pytest.fixture()
-def json_manager():
+def json_manager(tmp_path):
     """Fixture to provide a JSONFileManager instance."""
-    file_path = "test.json"
+    file_path = str(tmp_path / "test.json")
     return JSONFileManager(file_path)
 
 
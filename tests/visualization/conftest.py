@@ -1,21 +1,22 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
-import subprocess
-import sys
+import runpy
 from pathlib import Path
 
 import pytest
 
-try:
-    from tests.helpers import project_root
-except Exception:  # pragma: no cover - fallback when tests package not importable
+from tests.helpers import project_root
 
-    def project_root(start: Path | None = None) -> Path:
-        here = (start or Path(__file__)).resolve()
-        for anc in [here, *here.parents]:
-            if (anc / "pyproject.toml").exists():
-                return anc
-        return here.parents[-1]
+_UV_NAMES = {"u_stack.npy", "v_stack.npy"}
+
+
+def _sample_names(samples_dir: Path) -> set[str]:
+    """List ``samples_dir`` in one directory read (empty if missing)."""
+    try:
+        with os.scandir(samples_dir) as it:
+            return {e.name for e in it}
+    except OSError:
+        return set()
 
 
 @pytest.fixture(scope="session")
@@ -29,22 +30,26 @@ def ensure_uv_stacks():
     u_path = samples_dir / "u_stack.npy"
     v_path = samples_dir / "v_stack.npy"
 
-    if u_path.exists() and v_path.exists():
+    names = _sample_names(samples_dir)
+    if names >= _UV_NAMES:
         return str(u_path), str(v_path)
 
     gen = samples_dir / "generate_uv_stacks.py"
-    if not gen.exists():
+    if gen.name not in names:
         pytest.skip("samples/generate_uv_stacks.py not found")
 
-    # Run the generator; default creates u_stack.npy and v_stack.npy
-    env = os.environ.copy()
-    proc = subprocess.run(
-        [sys.executable, str(gen)], cwd=str(repo_root), capture_output=True, text=True
-    )
-    if proc.returncode != 0:
-        pytest.skip(f"Failed to generate U/V stacks: {proc.stderr}")
-
-    if not (u_path.exists() and v_path.exists()):
+    # Run the generator in-process rather than paying interpreter startup
+    # for a child; default creates u_stack.npy and v_stack.npy
+    argv = [str(gen), "--outdir", str(samples_dir)]
+    try:
+        gen_main = runpy.run_path(str(gen))["main"]
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("sys.argv", argv)
+            gen_main()
+    except (Exception, SystemExit) as exc:
+        pytest.skip(f"Failed to generate U/V stacks: {exc!r}")
+
+    if not _sample_names(samples_dir) >= _UV_NAMES:
         pytest.skip("Generator did not produce expected U/V stacks")
 
     return str(u_path), str(v_path)
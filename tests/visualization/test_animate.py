@@ -2,6 +2,7 @@
 import json
 import os
 import tempfile
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -36,7 +37,7 @@ def test_cli_animate_heatmap_npy():
     import sys
 
     t, ny, nx = 3, 16, 32
-    stack = np.random.rand(t, ny, nx).astype("float32")
+    stack = np.linspace(0, 1, t * ny * nx, dtype="float32").reshape(t, ny, nx)
     with tempfile.TemporaryDirectory() as td:
         npy = os.path.join(td, "stack.npy")
         outdir = os.path.join(td, "frames")
@@ -74,11 +75,17 @@ def test_cli_animate_heatmap_npy():
             "--height",
             "160",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        proc = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
         assert proc.returncode == 0, proc.stderr
         # Check manifest and frames while temp dir is alive
         assert os.path.exists(manifest)
-        data = json.loads(open(manifest).read())
+        data = json.loads(Path(manifest).read_bytes())
         assert data["count"] == t
         for i in range(t):
             path = os.path.join(outdir, f"frame_{i:04d}.png")
@@ -122,11 +129,17 @@ def test_cli_animate_vector_npy(ensure_uv_stacks):
             "--height",
             "160",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        proc = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
         assert proc.returncode == 0, proc.stderr
         # Check manifest and one frame exists
         assert os.path.exists(manifest)
-        data = json.loads(open(manifest).read())
+        data = json.loads(Path(manifest).read_bytes())
         assert data["count"] >= 1
         path = os.path.join(outdir, "frame_0000.png")
         assert os.path.exists(path)
@@ -5,6 +5,13 @@ import sys
 import pytest
 
 
+@pytest.fixture(scope="module")
+def cli_main():
+    from zyra.cli import main
+
+    return main
+
+
 @pytest.mark.cli
 @pytest.mark.parametrize(
     "cmd",
@@ -19,6 +26,29 @@ import pytest
         ["visualize", "sos", "--help"],
     ],
 )
-def test_visualize_subcommand_help_exits_zero(cmd):
-    proc = subprocess.run([sys.executable, "-m", "zyra.cli", *cmd], capture_output=True)
-    assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
+def test_visualize_subcommand_help_exits_zero(cmd, cli_main, capsys):
+    # In-process: argparse's --help raises SystemExit(0) after printing usage
+    with pytest.raises(SystemExit) as exc:
+        cli_main(cmd)
+    assert exc.value.code == 0, capsys.readouterr().err
+    assert "usage:" in capsys.readouterr().out
+
+
+@pytest.mark.cli
+def test_visualize_help_via_python_m_entrypoint():
+    # One real process keeps the ``python -m zyra.cli`` wiring covered
+    proc = subprocess.run(
+        [sys.executable, "-m", "zyra.cli", "visualize", "heatmap", "--help"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+@pytest.mark.cli
+def test_datavizhub_cli_shim_reexports_zyra_main(cli_main):
+    # The legacy module is a thin re-export; identity covers it without
+    # re-running the whole help matrix under a second module name
+    datavizhub_cli = pytest.importorskip("datavizhub.cli")
+    assert datavizhub_cli.main is cli_main
@@ -31,7 +31,7 @@ def test_heatmap_manager_colorbar_axes():
 
         pytest.skip(f"Visualization deps missing: {e}")
 
-    data = np.random.rand(10, 20)
+    data = np.linspace(0, 1, 10 * 20).reshape(10, 20)
     hm = HeatmapManager()
     fig = hm.render(
         data, width=200, height=100, dpi=100, colorbar=True, label="Value", units="m/s"
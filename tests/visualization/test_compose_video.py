@@ -52,6 +52,14 @@ def _make_frames_dir(td: str) -> str:
     return frames
 
 
+def _write_tiny_frames(frames: str) -> None:
+    """Write two tiny, valid PNG frames (even size keeps yuv420p encodable)."""
+    Image = pytest.importorskip("PIL.Image")
+    os.makedirs(frames, exist_ok=True)
+    for i, color in enumerate(("black", "white")):
+        Image.new("RGB", (8, 8), color).save(os.path.join(frames, f"frame_{i:04d}.png"))
+
+
 def test_preset_sos_resolves_defaults(captured_processor):
     from zyra.visualization.cli_compose_video import handle_compose_video
 
@@ -110,19 +118,9 @@ def test_preset_sos_output_matches_spec():
     import subprocess
     import sys
 
-    try:
-        import matplotlib.pyplot as plt
-    except Exception as e:
-        pytest.skip(f"Visualization deps missing: {e}")
-
     with tempfile.TemporaryDirectory() as td:
         frames = os.path.join(td, "frames")
-        os.makedirs(frames, exist_ok=True)
-        for i in range(2):
-            fig = plt.figure(figsize=(1, 1), dpi=50)
-            plt.text(0.5, 0.5, f"{i}", ha="center", va="center")
-            fig.savefig(os.path.join(frames, f"frame_{i:04d}.png"))
-            plt.close(fig)
+        _write_tiny_frames(frames)
         out = os.path.join(td, "out.mp4")
         cmd = [
             sys.executable,
@@ -137,7 +135,13 @@ def test_preset_sos_output_matches_spec():
             "--preset",
             "sos",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        proc = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
         assert proc.returncode == 0, proc.stderr
         assert os.path.exists(out)
         probe = subprocess.run(
@@ -166,43 +170,24 @@ def test_preset_sos_output_matches_spec():
         assert rate in ("30/1", "30000/1000")
 
 
-def test_cli_compose_video_smoke():
-    try:
-        # No hard dependency on ffmpeg; we just ensure graceful behavior
-        import matplotlib.pyplot as plt
-    except Exception as e:
-        import pytest
-
-        pytest.skip(f"Visualization deps missing: {e}")
-
-    import subprocess
-    import sys
-
-    with tempfile.TemporaryDirectory() as td:
-        frames = os.path.join(td, "frames")
-        os.makedirs(frames, exist_ok=True)
-        # Create two tiny frames
-        for i in range(2):
-            fig = plt.figure(figsize=(1, 1), dpi=50)
-            plt.text(0.5, 0.5, f"{i}", ha="center", va="center")
-            fig.savefig(os.path.join(frames, f"frame_{i:04d}.png"))
-            plt.close(fig)
-        out = os.path.join(td, "out.mp4")
-        cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+def test_cli_compose_video_smoke(run_cli, tmp_path):
+    # No hard dependency on ffmpeg; we just ensure graceful behavior
+    frames = tmp_path / "frames"
+    _write_tiny_frames(str(frames))
+    out = tmp_path / "out.mp4"
+    proc = run_cli(
+        [
             "visualize",
             "compose-video",
             "--frames",
-            frames,
+            str(frames),
             "-o",
-            out,
+            str(out),
             "--fps",
             "12",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        # Should return 0 regardless of ffmpeg availability (graceful skip)
-        assert proc.returncode == 0, proc.stderr
-        # If ffmpeg is present, an MP4 may be created; if not, that's fine
-        # We just care that the command doesn't error out.
+    )
+    # Should return 0 regardless of ffmpeg availability (graceful skip)
+    assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
+    # If ffmpeg is present, an MP4 may be created; if not, that's fine
+    # We just care that the command doesn't error out.
@@ -1,6 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
-import tempfile
 
 import pytest
 
@@ -26,80 +25,46 @@ def _make_netcdf_with_crs(path: str, epsg: str = "EPSG:3857"):
     import numpy as np
     import xarray as xr
 
-    data = (np.random.rand(4, 6)).astype("float32")
+    data = np.linspace(0, 1, 4 * 6, dtype="float32").reshape(4, 6)
     da = xr.DataArray(data, dims=("y", "x"))
     ds = xr.Dataset({"var": da})
     ds.attrs["crs"] = epsg
-    ds.to_netcdf(path)
-
-
-def test_cli_heatmap_crs_warning():
-    try:
-        import cartopy  # noqa: F401
-        import matplotlib  # noqa: F401
-        import xarray  # noqa: F401
-    except Exception as e:
-        import pytest
-
-        pytest.skip(f"Visualization deps missing: {e}")
-
-    import subprocess
-    import sys
-
-    with tempfile.TemporaryDirectory() as td:
-        nc = os.path.join(td, "crs.nc")
-        _make_netcdf_with_crs(nc, epsg="EPSG:3857")
-        out = os.path.join(td, "out.png")
-        cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
-            "heatmap",
-            "--input",
-            nc,
-            "--var",
-            "var",
-            "--output",
-            out,
-        ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
-        # Expect a mismatch warning in stderr
-        assert "differs from display CRS" in (proc.stderr or "")
-
-
-def test_cli_heatmap_crs_override_suppresses_warning():
-    try:
-        import cartopy  # noqa: F401
-        import matplotlib  # noqa: F401
-        import xarray  # noqa: F401
-    except Exception as e:
-        import pytest
-
-        pytest.skip(f"Visualization deps missing: {e}")
-
-    import subprocess
-    import sys
-
-    with tempfile.TemporaryDirectory() as td:
-        nc = os.path.join(td, "crs.nc")
-        _make_netcdf_with_crs(nc, epsg="EPSG:3857")
-        out = os.path.join(td, "out.png")
-        cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+    # NetCDF3 via scipy: no HDF5 init, and scipy ships with the visualization extra
+    ds.to_netcdf(path, engine="scipy")
+
+
+@pytest.fixture(scope="module")
+def crs_nc(tmp_path_factory) -> str:
+    """EPSG:3857-tagged NetCDF written once; the heatmap tests only read it."""
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("xarray")
+    path = str(tmp_path_factory.mktemp("crs") / "crs.nc")
+    _make_netcdf_with_crs(path, epsg="EPSG:3857")
+    return path
+
+
+@pytest.mark.parametrize(
+    "extra,expect_warning",
+    [
+        ([], True),
+        # Forcing the CRS to the display CRS silences the mismatch warning
+        (["--crs", "EPSG:4326"], False),
+    ],
+)
+def test_cli_heatmap_crs_warning(crs_nc, tmp_path, run_cli, extra, expect_warning):
+    out = str(tmp_path / "out.png")
+    proc = run_cli(
+        [
+            "visualize",
             "heatmap",
             "--input",
-            nc,
+            crs_nc,
             "--var",
             "var",
             "--output",
             out,
-            "--crs",
-            "EPSG:4326",
+            *extra,
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
-        # No mismatch warning because user forced CRS to 4326
-        assert "differs from display CRS" not in (proc.stderr or "")
+    )
+    assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
+    assert (b"differs from display CRS" in proc.stderr) is expect_warning
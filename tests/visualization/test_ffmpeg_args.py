@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from zyra.visualization.cli_animate import _build_ffmpeg_grid_args
+from zyra.visualization.cli_animate import _build_ffmpeg_grid_args, _xstack_layout
 
 
 def _touch(path: Path) -> None:
@@ -83,3 +83,7 @@ def test_build_ffmpeg_grid_args_validations(tmp_path: Path) -> None:
             grid_mode="grid",
             cols=1,
         )
+
+
+def test_xstack_layout_wraps_rows_at_cols() -> None:
+    assert _xstack_layout(3, 2) == "0_0|w0*1_0|0_h0*1"
@@ -8,7 +8,7 @@ import numpy as np
 from tests.helpers import project_root
 
 
-def test_interactive_folium_heatmap_html():
+def test_interactive_folium_heatmap_html(run_cli):
     try:
         import folium  # noqa: F401
     except Exception as e:
@@ -16,18 +16,13 @@ def test_interactive_folium_heatmap_html():
 
         pytest.skip(f"Optional interactive deps missing: {e}")
 
-    import subprocess
-    import sys
-
-    arr = np.random.rand(10, 20).astype("float32")
+    arr = np.linspace(0, 1, 10 * 20, dtype="float32").reshape(10, 20)
     with tempfile.TemporaryDirectory() as td:
         npy = os.path.join(td, "arr.npy")
         out = os.path.join(td, "interactive.html")
         np.save(npy, arr)
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+            "visualize",
             "interactive",
             "--input",
             npy,
@@ -38,15 +33,15 @@ def test_interactive_folium_heatmap_html():
             "--mode",
             "heatmap",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(out)
         # Basic HTML structure
         text = Path(out).read_text(encoding="utf-8")[:200].lower()
         assert "<html" in text
 
 
-def test_interactive_plotly_heatmap_html():
+def test_interactive_plotly_heatmap_html(run_cli):
     try:
         import plotly  # noqa: F401
     except Exception as e:
@@ -54,18 +49,13 @@ def test_interactive_plotly_heatmap_html():
 
         pytest.skip(f"Optional interactive deps missing: {e}")
 
-    import subprocess
-    import sys
-
-    arr = np.random.rand(6, 12).astype("float32")
+    arr = np.linspace(0, 1, 6 * 12, dtype="float32").reshape(6, 12)
     with tempfile.TemporaryDirectory() as td:
         npy = os.path.join(td, "arr.npy")
         out = os.path.join(td, "interactive_plotly.html")
         np.save(npy, arr)
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+            "visualize",
             "interactive",
             "--input",
             npy,
@@ -80,14 +70,14 @@ def test_interactive_plotly_heatmap_html():
             "--height",
             "300",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(out)
         text = Path(out).read_text(encoding="utf-8")[:200].lower()
         assert "<html" in text
 
 
-def test_interactive_folium_points_html():
+def test_interactive_folium_points_html(run_cli):
     try:
         import folium  # noqa: F401
     except Exception as e:
@@ -96,8 +86,6 @@ def test_interactive_folium_points_html():
         pytest.skip(f"Optional interactive deps missing: {e}")
 
     import os
-    import subprocess
-    import sys
     import tempfile
 
     # Use provided samples/points.csv
@@ -111,9 +99,7 @@ def test_interactive_folium_points_html():
     with tempfile.TemporaryDirectory() as td:
         out = os.path.join(td, "points.html")
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+            "visualize",
             "interactive",
             "--input",
             str(points_csv),
@@ -124,14 +110,14 @@ def test_interactive_folium_points_html():
             "--mode",
             "points",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(out)
         text = Path(out).read_text(encoding="utf-8")[:200].lower()
         assert "<html" in text
 
 
-def test_interactive_folium_vector_quiver_html():
+def test_interactive_folium_vector_quiver_html(run_cli):
     try:
         import folium  # noqa: F401
     except Exception as e:
@@ -140,8 +126,6 @@ def test_interactive_folium_vector_quiver_html():
         pytest.skip(f"Optional interactive deps missing: {e}")
 
     import os
-    import subprocess
-    import sys
     import tempfile
 
     import numpy as np
@@ -156,9 +140,7 @@ def test_interactive_folium_vector_quiver_html():
         np.save(up, U)
         np.save(vp, V)
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+            "visualize",
             "interactive",
             "--mode",
             "vector",
@@ -171,14 +153,14 @@ def test_interactive_folium_vector_quiver_html():
             "--engine",
             "folium",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(out)
         text = Path(out).read_text(encoding="utf-8")[:200].lower()
         assert "<html" in text
 
 
-def test_interactive_folium_vector_streamlines_html():
+def test_interactive_folium_vector_streamlines_html(run_cli):
     try:
         import folium  # noqa: F401
     except Exception as e:
@@ -187,8 +169,6 @@ def test_interactive_folium_vector_streamlines_html():
         pytest.skip(f"Optional interactive deps missing: {e}")
 
     import os
-    import subprocess
-    import sys
     import tempfile
 
     import numpy as np
@@ -207,9 +187,7 @@ def test_interactive_folium_vector_streamlines_html():
         np.save(up, U)
         np.save(vp, V)
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+            "visualize",
             "interactive",
             "--mode",
             "vector",
@@ -223,8 +201,8 @@ def test_interactive_folium_vector_streamlines_html():
             "folium",
             "--streamlines",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(out)
         text = Path(out).read_text(encoding="utf-8")[:200].lower()
         assert "<html" in text
@@ -298,7 +298,7 @@ class TestDataEncodedCli:
             # canvas — applying that here would resample every frame.
             assert im.size == (2, 2)
             assert np.asarray(im)[0, 1] == 255
-        scale = json.loads(sidecar.read_text())
+        scale = json.loads(sidecar.read_bytes())
         assert scale["vmin"] == 0 and scale["vmax"] == 100
         assert scale["units"] == "K"
         assert len(scale["stops"]) == SIDECAR_STOPS
@@ -339,7 +339,7 @@ class TestDataEncodedCli:
         )
 
         assert handle_heatmap(ns) == 0
-        scale = json.loads(sidecar.read_text())
+        scale = json.loads(sidecar.read_bytes())
         # The bands came from the palette, not the greyscale fallback
         # (which would put equal values on all three channels).
         assert scale["stops"][SIDECAR_STOPS // 4]["rgba"][:3] == [0, 0, 255]
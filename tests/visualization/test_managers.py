@@ -76,7 +76,7 @@ def test_contour_manager_renders_png():
         assert os.path.getsize(path) > 0
 
 
-def test_cli_heatmap_smoke():
+def test_cli_heatmap_smoke(run_cli):
     # Smoke run CLI with a small .npy array
     try:
         import cartopy  # noqa: F401
@@ -86,19 +86,14 @@ def test_cli_heatmap_smoke():
 
         pytest.skip(f"Visualization deps missing: {e}")
 
-    arr = np.random.rand(16, 32).astype("float32")
+    arr = np.linspace(0, 1, 16 * 32, dtype="float32").reshape(16, 32)
     with tempfile.TemporaryDirectory() as td:
         npy = os.path.join(td, "a.npy")
         out = os.path.join(td, "out.png")
         np.save(npy, arr)
 
-        import subprocess
-        import sys
-
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.visualization.cli",
+            "visualize",
             "heatmap",
             "--input",
             npy,
@@ -109,7 +104,7 @@ def test_cli_heatmap_smoke():
             "--height",
             "128",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(out)
         assert os.path.getsize(out) > 0
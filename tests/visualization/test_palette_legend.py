@@ -325,21 +325,15 @@ def test_write_legend_classified_bands(tmp_path):
     assert Image.open(out).size[0] > 0
 
 
-def test_cli_malformed_palette_exits_2(tmp_path):
-    import subprocess
-    import sys
-
+def test_cli_malformed_palette_exits_2(tmp_path, run_cli):
     import numpy as np
 
     npy = tmp_path / "d.npy"
     np.save(npy, np.zeros((4, 8), dtype="float32"))
     bad = tmp_path / "bad.json"
     bad.write_text('{"type": "classified", "entries": []}')
-    proc = subprocess.run(
+    proc = run_cli(
         [
-            sys.executable,
-            "-m",
-            "zyra.cli",
             "visualize",
             "heatmap",
             "--input",
@@ -348,14 +342,11 @@ def test_cli_malformed_palette_exits_2(tmp_path):
             str(tmp_path / "o.png"),
             "--cmap-file",
             str(bad),
-        ],
-        capture_output=True,
-        text=True,
-        check=False,
+        ]
     )
     assert proc.returncode == 2
-    assert "at least 2 entries" in proc.stderr
-    assert "Traceback" not in proc.stderr
+    assert b"at least 2 entries" in proc.stderr
+    assert b"Traceback" not in proc.stderr
 
 
 # Cartopy-heavy render tests: opt-in via DATAVIZHUB_RUN_CARTOPY_TESTS=1
@@ -427,7 +418,7 @@ def test_cli_legend_file_written_frame_unchanged(tmp_path):
     import numpy as np
 
     npy = tmp_path / "d.npy"
-    np.save(npy, np.random.rand(20, 40).astype("float32") * 60)
+    np.save(npy, np.linspace(0, 60, 20 * 40, dtype="float32").reshape(20, 40))
     frame_plain = tmp_path / "plain.png"
     frame_legend = tmp_path / "with_legend.png"
     legend = tmp_path / "legend.png"
@@ -590,16 +581,21 @@ def test_load_palette_url_non_utf8(monkeypatch):
         load_palette_spec("https://example.org/p.png")
 
 
-def test_cli_unreachable_palette_url_exits_2(tmp_path):
-    import subprocess
-    import sys
-
+def test_cli_unreachable_palette_url_exits_2(tmp_path, run_cli, monkeypatch):
     url = "http://127.0.0.1:1/palette.json"
-    proc = subprocess.run(
+    # Never let an ambient proxy turn a refused connection into
+    # a slow upstream error.
+    monkeypatch.setenv("no_proxy", "*")
+    monkeypatch.setenv("NO_PROXY", "*")
+    # This test is about the exit code and the message, not
+    # about retry behavior. A refused connection is already
+    # non-retryable, but pinning attempts keeps the test fast
+    # and deterministic on a CI network that drops the packet
+    # instead of refusing it — where each attempt would
+    # otherwise wait out the full 60s request timeout.
+    monkeypatch.setenv("ZYRA_HTTP_MAX_ATTEMPTS", "1")
+    proc = run_cli(
         [
-            sys.executable,
-            "-m",
-            "zyra.cli",
             "visualize",
             "heatmap",
             "--input",
@@ -608,25 +604,8 @@ def test_cli_unreachable_palette_url_exits_2(tmp_path):
             str(tmp_path / "o.png"),
             "--cmap-file",
             url,
-        ],
-        capture_output=True,
-        text=True,
-        check=False,
-        env={
-            **os.environ,
-            # Never let an ambient proxy turn a refused connection into
-            # a slow upstream error.
-            "no_proxy": "*",
-            "NO_PROXY": "*",
-            # This test is about the exit code and the message, not
-            # about retry behavior. A refused connection is already
-            # non-retryable, but pinning attempts keeps the test fast
-            # and deterministic on a CI network that drops the packet
-            # instead of refusing it — where each attempt would
-            # otherwise wait out the full 60s request timeout.
-            "ZYRA_HTTP_MAX_ATTEMPTS": "1",
-        },
+        ]
     )
     assert proc.returncode == 2
-    assert url in proc.stderr
-    assert "Traceback" not in proc.stderr
+    assert url.encode() in proc.stderr
+    assert b"Traceback" not in proc.stderr
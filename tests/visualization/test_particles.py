@@ -2,6 +2,7 @@
 import json
 import os
 import tempfile
+from pathlib import Path
 
 import pytest
 
@@ -23,7 +24,7 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-def test_cli_particles_npy_smoke(ensure_uv_stacks):
+def test_cli_particles_npy_smoke(ensure_uv_stacks, run_cli):
     try:
         import matplotlib  # noqa: F401
     except Exception as e:
@@ -31,17 +32,12 @@ def test_cli_particles_npy_smoke(ensure_uv_stacks):
 
         pytest.skip(f"Visualization deps missing: {e}")
 
-    import subprocess
-    import sys
-
     up, vp = ensure_uv_stacks
     with tempfile.TemporaryDirectory() as td:
         outdir = os.path.join(td, "frames")
         manifest = os.path.join(td, "manifest.json")
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
+            "visualize",
             "animate",
             "--mode",
             "particles",
@@ -60,10 +56,10 @@ def test_cli_particles_npy_smoke(ensure_uv_stacks):
             "--particles",
             "50",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(manifest)
-        data = json.loads(open(manifest).read())
+        data = json.loads(Path(manifest).read_bytes())
         assert data["count"] >= 1
         # At least frame_0000.png should exist
         path = os.path.join(outdir, "frame_0000.png")
@@ -2,8 +2,6 @@
 """Tests for the ``visualize sos`` (Science On a Sphere) subcommand."""
 
 import os
-import subprocess
-import sys
 import tempfile
 
 import numpy as np
@@ -28,11 +26,8 @@ _cartopy_skip = pytest.mark.skipif(
 
 
 @pytest.mark.cli
-def test_sos_help_exits_zero():
-    proc = subprocess.run(
-        [sys.executable, "-m", "zyra.cli", "visualize", "sos", "--help"],
-        capture_output=True,
-    )
+def test_sos_help_exits_zero(run_cli):
+    proc = run_cli(["visualize", "sos", "--help"])
     assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
     out = proc.stdout.decode(errors="ignore")
     assert "--vmin" in out and "--vmax" in out
@@ -88,7 +83,7 @@ def test_sos_batch_render_failure_exits_nonzero(tmp_path, monkeypatch):
 def test_load_data_array_npy_roundtrip():
     from zyra.visualization.cli_utils import load_data_array
 
-    arr = np.random.rand(8, 16).astype("float32")
+    arr = np.linspace(0, 1, 8 * 16, dtype="float32").reshape(8, 16)
     with tempfile.TemporaryDirectory() as td:
         npy = os.path.join(td, "a.npy")
         np.save(npy, arr)
@@ -1,7 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
-import subprocess
-import sys
 
 import pytest
 
@@ -22,12 +20,9 @@ pytestmark = pytest.mark.skipif(
 
 
 @pytest.mark.cli
-def test_heatmap_tiles_smoke(tmp_path):
+def test_heatmap_tiles_smoke(tmp_path, run_cli):
     out_file = tmp_path / "heatmap_tiles.png"
     cmd = [
-        sys.executable,
-        "-m",
-        "zyra.cli",
         "visualize",
         "heatmap",
         "--input",
@@ -39,19 +34,16 @@ def test_heatmap_tiles_smoke(tmp_path):
         "--tile-zoom",
         "2",
     ]
-    result = subprocess.run(cmd)
-    assert result.returncode == 0
+    proc = run_cli(cmd)
+    assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
     assert out_file.exists()
 
 
 @pytest.mark.cli
-def test_animate_tiles_smoke(tmp_path):
+def test_animate_tiles_smoke(tmp_path, run_cli):
     out_dir = tmp_path / "frames"
     manifest = tmp_path / "manifest.json"
     cmd = [
-        sys.executable,
-        "-m",
-        "zyra.cli",
         "visualize",
         "animate",
         "--mode",
@@ -71,8 +63,8 @@ def test_animate_tiles_smoke(tmp_path):
         "--height",
         "160",
     ]
-    result = subprocess.run(cmd)
-    assert result.returncode == 0
+    proc = run_cli(cmd)
+    assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
     assert manifest.exists()
     # At least the first frame should exist
     first = out_dir / "frame_0000.png"
@@ -80,12 +72,9 @@ def test_animate_tiles_smoke(tmp_path):
 
 
 @pytest.mark.cli
-def test_contour_tiles_smoke(tmp_path):
+def test_contour_tiles_smoke(tmp_path, run_cli):
     out_file = tmp_path / "contour_tiles.png"
     cmd = [
-        sys.executable,
-        "-m",
-        "zyra.cli",
         "visualize",
         "contour",
         "--input",
@@ -100,6 +89,6 @@ def test_contour_tiles_smoke(tmp_path):
         "--tile-zoom",
         "2",
     ]
-    result = subprocess.run(cmd)
-    assert result.returncode == 0
+    proc = run_cli(cmd)
+    assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
     assert out_file.exists()
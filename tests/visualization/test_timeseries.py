@@ -33,7 +33,7 @@ def test_timeseries_manager_csv():
         assert os.path.getsize(path) > 0
 
 
-def test_cli_timeseries_csv_smoke():
+def test_cli_timeseries_csv_smoke(run_cli):
     try:
         import matplotlib  # noqa: F401
         import pandas  # noqa: F401
@@ -42,9 +42,6 @@ def test_cli_timeseries_csv_smoke():
 
         pytest.skip(f"Visualization deps missing: {e}")
 
-    import subprocess
-    import sys
-
     import numpy as np
     import pandas as pd
 
@@ -56,9 +53,6 @@ def test_cli_timeseries_csv_smoke():
         pd.DataFrame({"t": x, "v": y}).to_csv(csv_path, index=False)
 
         cmd = [
-            sys.executable,
-            "-m",
-            "zyra.cli",
             "visualize",
             "timeseries",
             "--input",
@@ -74,7 +68,7 @@ def test_cli_timeseries_csv_smoke():
             "--height",
             "200",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        assert proc.returncode == 0, proc.stderr
+        proc = run_cli(cmd)
+        assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
         assert os.path.exists(out)
         assert os.path.getsize(out) > 0
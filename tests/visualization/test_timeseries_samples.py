@@ -1,13 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
 
 @pytest.mark.cli
-def test_cli_timeseries_samples_csv(tmp_path):
+def test_cli_timeseries_samples_csv(tmp_path, run_cli):
     try:
         import matplotlib  # noqa: F401
         import pandas  # noqa: F401
@@ -23,9 +21,6 @@ def test_cli_timeseries_samples_csv(tmp_path):
 
     out = tmp_path / "ts_sample.png"
     cmd = [
-        sys.executable,
-        "-m",
-        "zyra.cli",
         "visualize",
         "timeseries",
         "--input",
@@ -41,7 +36,7 @@ def test_cli_timeseries_samples_csv(tmp_path):
         "--height",
         "200",
     ]
-    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    assert proc.returncode == 0, proc.stderr
+    proc = run_cli(cmd)
+    assert proc.returncode == 0, proc.stderr.decode(errors="ignore")
     assert out.exists()
     assert out.stat().st_size > 0
@@ -47,7 +47,7 @@ def _render(extent):
     from zyra.visualization.heatmap_manager import HeatmapManager
 
     mgr = HeatmapManager(extent=extent)
-    data = np.random.rand(20, 40).astype("float32")
+    data = np.linspace(0, 1, 20 * 40, dtype="float32").reshape(20, 40)
     fig = mgr.render(data)
     assert fig is not None
     geo_axes = [a for a in fig.axes if hasattr(a, "get_extent")]